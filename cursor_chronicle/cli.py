@@ -5,6 +5,7 @@ Command-line interface for Cursor Chronicle.
 import argparse
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -23,17 +24,19 @@ from .messages import get_dialog_messages
 from .statistics import show_statistics
 from .viewer import CursorChatViewer
 
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%d.%m.%Y",
+    "%d/%m/%Y",
+)
+
 
+@lru_cache(maxsize=256)
 def parse_date(date_str: str) -> datetime:
     """Parse date string in various formats."""
-    formats = [
-        "%Y-%m-%d",
-        "%Y-%m-%d %H:%M",
-        "%Y-%m-%d %H:%M:%S",
-        "%d.%m.%Y",
-        "%d/%m/%Y",
-    ]
-    for fmt in formats:
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
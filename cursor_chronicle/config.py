@@ -9,7 +9,8 @@ import json
 import os
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 # Default config directory
 DEFAULT_CONFIG_DIR = Path.home() / ".cursor-chronicle"
@@ -26,12 +27,14 @@ DEFAULT_EXPORT_PATH = Path(tempfile.gettempdir()) / "cursor-chronicle-export"
 # Default backup path
 DEFAULT_BACKUP_PATH = DEFAULT_CONFIG_DIR / "backups"
 
-# Default configuration values
-DEFAULT_CONFIG = {
-    "export_path": str(DEFAULT_EXPORT_PATH),
-    "verbosity": VERBOSITY_STANDARD,
-    "backup_path": str(DEFAULT_BACKUP_PATH),
-}
+# Default configuration values (read-only; load_config returns a mutable copy)
+DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "export_path": str(DEFAULT_EXPORT_PATH),
+        "verbosity": VERBOSITY_STANDARD,
+        "backup_path": str(DEFAULT_BACKUP_PATH),
+    }
+)
 
 
 def get_config_path() -> Path:
@@ -70,7 +73,7 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     return config
 
 
-def save_config(config: Dict[str, Any], config_path: Optional[Path] = None) -> None:
+def save_config(config: Mapping[str, Any], config_path: Optional[Path] = None) -> None:
     """
     Save configuration to file.
 
@@ -86,7 +89,7 @@ def save_config(config: Dict[str, Any], config_path: Optional[Path] = None) -> N
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+        json.dump(dict(config), f, indent=2, ensure_ascii=False)
 
 
 def ensure_config_exists(config_path: Optional[Path] = None) -> Dict[str, Any]:
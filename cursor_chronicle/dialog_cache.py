@@ -0,0 +1,59 @@
+"""
+Small LRU cache for CursorChatViewer.get_all_dialogs results.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+def storage_signature(global_storage_path: Path, workspace_storage_path: Path) -> Tuple:
+    """(path, mtime_ns, size) of every file get_projects reads.
+
+    WAL sidecars are included because Cursor's writes land there before
+    they are checkpointed into the main database file.
+    """
+    files = [
+        global_storage_path,
+        global_storage_path.with_name(global_storage_path.name + "-wal"),
+    ]
+    if workspace_storage_path.is_dir():
+        for workspace_dir in sorted(workspace_storage_path.iterdir()):
+            files.append(workspace_dir / "workspace.json")
+            files.append(workspace_dir / "state.vscdb")
+            files.append(workspace_dir / "state.vscdb-wal")
+
+    signature = []
+    for path in files:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        signature.append((str(path), st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+class DialogCache:
+    """Bounded LRU of dialog lists, each tagged with its storage signature."""
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Tuple, List[Dict]]]" = OrderedDict()
+
+    def get(self, key: Hashable, signature: Tuple) -> Optional[List[Dict]]:
+        """Return a copy of the cached dialogs, or None if missing or stale."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != signature:
+            return None
+        self._entries.move_to_end(key)
+        return [dict(d) for d in entry[1]]
+
+    def put(self, key: Hashable, signature: Tuple, dialogs: List[Dict]) -> None:
+        """Store a copy of dialogs, evicting the least recently used entry."""
+        self._entries[key] = (signature, [dict(d) for d in dialogs])
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,11 +4,10 @@ Message extraction and processing from Cursor database.
 
 import base64
 import json
-import sqlite3
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from .utils import get_cursor_paths
+from .utils import connect_state_db, get_cursor_paths
 
 # Module-level override for testing
 _global_storage_override: Optional[Path] = None
@@ -26,7 +25,7 @@ def get_dialog_messages(composer_id: str, db_path: Optional[Path] = None) -> Lis
     if not global_storage_path.exists():
         raise FileNotFoundError(f"Global database not found: {global_storage_path}")
 
-    with sqlite3.connect(global_storage_path) as conn:
+    with connect_state_db(global_storage_path) as conn:
         cursor = conn.cursor()
 
         cursor.execute(
@@ -248,16 +247,26 @@ def extract_attached_files(bubble_data: Dict) -> List[Dict]:
 
 
 def extract_files_from_layout(layout_data: Dict, current_path: str = "") -> List[str]:
-    """Recursively extract all file paths from project structure."""
-    files = []
-
-    if isinstance(layout_data, dict):
-        for key, value in layout_data.items():
-            new_path = f"{current_path}/{key}" if current_path else key
-
+    """Extract all file paths from project structure.
+
+    Walks the tree with an explicit stack of item iterators, so deeply nested
+    layouts cannot hit the recursion limit; paths keep depth-first key order.
+    """
+    files: List[str] = []
+    if not isinstance(layout_data, dict):
+        return files
+
+    stack = [(current_path, iter(layout_data.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            path = f"{prefix}/{key}" if prefix else key
             if isinstance(value, dict):
-                files.extend(extract_files_from_layout(value, new_path))
-            elif value is None:
-                files.append(new_path)
+                stack.append((path, iter(value.items())))
+                break
+            if value is None:
+                files.append(path)
+        else:
+            stack.pop()
 
     return files
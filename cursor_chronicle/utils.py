@@ -9,7 +9,7 @@ import sqlite3
 import sys
 import urllib.parse
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Handle broken pipe gracefully
 signal.signal(signal.SIGPIPE, signal.SIG_DFL)
@@ -116,7 +116,10 @@ def parse_composer_workspace_identifier(comp: Dict) -> Tuple[str, str]:
     uri_obj = ws.get("uri") or {}
     if isinstance(uri_obj, dict):
         folder_path = (
-            uri_obj.get("fsPath") or uri_obj.get("path") or uri_obj.get("external") or ""
+            uri_obj.get("fsPath")
+            or uri_obj.get("path")
+            or uri_obj.get("external")
+            or ""
         )
     elif isinstance(uri_obj, str):
         folder_path = uri_obj
@@ -131,6 +134,28 @@ def parse_composer_workspace_identifier(comp: Dict) -> Tuple[str, str]:
     return project_name, folder_path
 
 
+# Read-side tuning only: anything persistent (journal_mode, PRAGMA optimize)
+# would write to a database Cursor owns and may hold open.
+_READ_PRAGMAS = (
+    "PRAGMA query_only = ON",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+)
+
+
+def connect_state_db(db_path: Path) -> sqlite3.Connection:
+    """
+    Open a Cursor ``state.vscdb`` for reading.
+
+    The connection refuses writes, keeps temporary sort tables in memory and
+    reads pages through a 256 MiB mmap window with a 64 MiB page cache.
+    """
+    conn = sqlite3.connect(db_path)
+    for pragma in _READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
 
 def load_global_composer_headers(global_storage_path: Path) -> List[Dict]:
     """
@@ -142,7 +167,7 @@ def load_global_composer_headers(global_storage_path: Path) -> List[Dict]:
     if not global_storage_path.exists():
         return []
     try:
-        with sqlite3.connect(global_storage_path) as conn:
+        with connect_state_db(global_storage_path) as conn:
             cur = conn.cursor()
             cur.execute(
                 "SELECT value FROM ItemTable WHERE key = 'composer.composerHeaders'"
@@ -155,6 +180,77 @@ def load_global_composer_headers(global_storage_path: Path) -> List[Dict]:
     return []
 
 
+# Expands an ``allComposers`` blob row by row and returns each composer's id,
+# plus its JSON only when the date field falls inside the window. A NULL bound
+# leaves that side open; a missing date counts as 0, as in the Python filter.
+_COMPOSERS_IN_WINDOW_SQL = """
+    SELECT json_extract(c.value, '$.composerId'),
+           CASE WHEN (:start_ts IS NULL
+                      OR COALESCE(json_extract(c.value, :field), 0) >= :start_ts)
+                 AND (:end_ts IS NULL
+                      OR COALESCE(json_extract(c.value, :field), 0) <= :end_ts)
+                THEN c.value END
+    FROM ItemTable, json_each(ItemTable.value, '$.allComposers') AS c
+    WHERE ItemTable.key = :key
+"""
+
+
+def select_composers(
+    conn: sqlite3.Connection,
+    key: str,
+    date_field: Optional[str] = None,
+    start_ts: Optional[int] = None,
+    end_ts: Optional[int] = None,
+) -> Tuple[List[Dict], List[str]]:
+    """
+    Read the ``allComposers`` list stored under ItemTable ``key``.
+
+    Args:
+        conn: Open connection to a ``state.vscdb``
+        key: ItemTable key (``composer.composerHeaders`` or ``composer.composerData``)
+        date_field: Composer field to filter on (``createdAt`` or ``lastUpdatedAt``)
+        start_ts: Inclusive lower bound in ms since epoch, or None
+        end_ts: Inclusive upper bound in ms since epoch, or None
+
+    Returns:
+        (composers inside the window, ids of every composer under ``key``).
+        The ids let callers deduplicate across sources regardless of the window.
+
+    The window is evaluated by SQLite through json_each, so composers outside
+    it are never decoded in Python. Without a window, or when SQLite lacks the
+    JSON1 functions, the blob is decoded whole and filtered here instead.
+    """
+    windowed = date_field is not None and (start_ts is not None or end_ts is not None)
+    if windowed:
+        try:
+            rows = conn.execute(
+                _COMPOSERS_IN_WINDOW_SQL,
+                {
+                    "key": key,
+                    "field": f"$.{date_field}",
+                    "start_ts": start_ts,
+                    "end_ts": end_ts,
+                },
+            ).fetchall()
+        except sqlite3.OperationalError:
+            pass
+        else:
+            composers = [json.loads(value) for _, value in rows if value is not None]
+            return composers, [cid for cid, _ in rows if cid]
+
+    row = conn.execute("SELECT value FROM ItemTable WHERE key = ?", (key,)).fetchone()
+    composers = json.loads(row[0]).get("allComposers", []) if row else []
+    ids = [c.get("composerId") for c in composers if c.get("composerId")]
+    if windowed:
+        composers = [
+            c
+            for c in composers
+            if (start_ts is None or c.get(date_field, 0) >= start_ts)
+            and (end_ts is None or c.get(date_field, 0) <= end_ts)
+        ]
+    return composers, ids
+
+
 # Tool type mapping for display
 TOOL_TYPES = {
     1: "🔍 Codebase Search",
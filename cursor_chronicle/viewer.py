@@ -3,11 +3,11 @@ Core CursorChatViewer class - project and dialog data access.
 """
 
 import json
-import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .dialog_cache import DialogCache, storage_signature
 from .formatters import format_attached_files as _format_attached_files
 from .formatters import format_token_info as _format_token_info
 from .formatters import format_tool_call as _format_tool_call
@@ -15,10 +15,11 @@ from .formatters import infer_model_from_context as _infer_model_from_context
 from .messages import get_dialog_messages as _get_dialog_messages
 from .utils import (
     TOOL_TYPES,
+    connect_state_db,
     get_cursor_paths,
-    load_global_composer_headers,
     parse_composer_workspace_identifier,
     parse_workspace_storage_meta,
+    select_composers,
 )
 
 
@@ -31,6 +32,7 @@ class CursorChatViewer:
         self.workspace_storage_path = paths[1]
         self.global_storage_path = paths[2]
         self.tool_types = TOOL_TYPES
+        self._dialog_cache = DialogCache()
 
     def get_dialog_messages(self, composer_id: str) -> List[Dict]:
         """Get all dialog messages by composer ID."""
@@ -70,29 +72,48 @@ class CursorChatViewer:
         1. Global ``composer.composerHeaders`` (Cursor 3.0+, April 2026).
         2. Per-workspace ``composer.composerData`` (legacy, pre-3.0).
         """
+        return self._collect_projects()
+
+    def _collect_projects(
+        self,
+        date_field: Optional[str] = None,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+    ) -> List[Dict]:
+        """Build the project list, keeping only composers inside the date window.
+
+        The window (see select_composers) is evaluated in SQL. Deduplication
+        still uses every composer id, so a dialog outside the window in one
+        source cannot resurface from another.
+        """
         by_project: Dict[str, Dict] = {}
         seen_composer_ids: set = set()
 
         # --- Cursor 3.0+: global composerHeaders with workspaceIdentifier ---
-        global_composers = load_global_composer_headers(self.global_storage_path)
-        if global_composers:
-            for comp in global_composers:
-                composer_id = comp.get("composerId")
-                if composer_id:
-                    seen_composer_ids.add(composer_id)
-                project_name, folder_path = parse_composer_workspace_identifier(comp)
-                key = folder_path
-                if key not in by_project:
-                    ws = comp.get("workspaceIdentifier") or {}
-                    by_project[key] = {
-                        "workspace_id": ws.get("id", ""),
-                        "project_name": project_name,
-                        "folder_path": folder_path,
-                        "composers": [],
-                        "latest_dialog": None,
-                        "state_db_path": str(self.global_storage_path),
-                    }
-                by_project[key]["composers"].append(comp)
+        global_composers: List[Dict] = []
+        if self.global_storage_path.exists():
+            try:
+                with connect_state_db(self.global_storage_path) as conn:
+                    global_composers, global_ids = select_composers(
+                        conn, "composer.composerHeaders", date_field, start_ts, end_ts
+                    )
+                seen_composer_ids.update(global_ids)
+            except Exception:
+                global_composers = []
+        for comp in global_composers:
+            project_name, folder_path = parse_composer_workspace_identifier(comp)
+            key = folder_path
+            if key not in by_project:
+                ws = comp.get("workspaceIdentifier") or {}
+                by_project[key] = {
+                    "workspace_id": ws.get("id", ""),
+                    "project_name": project_name,
+                    "folder_path": folder_path,
+                    "composers": [],
+                    "latest_dialog": None,
+                    "state_db_path": str(self.global_storage_path),
+                }
+            by_project[key]["composers"].append(comp)
 
         # --- Legacy: per-workspace composerData (pre-3.0) ---
         if self.workspace_storage_path.exists():
@@ -114,36 +135,32 @@ class CursorChatViewer:
                         workspace_data
                     )
 
-                    with sqlite3.connect(state_db) as conn:
-                        cursor = conn.cursor()
-                        cursor.execute(
-                            "SELECT value FROM ItemTable WHERE key = 'composer.composerData'"
+                    with connect_state_db(state_db) as conn:
+                        composers, composer_ids = select_composers(
+                            conn, "composer.composerData", date_field, start_ts, end_ts
                         )
-                        result = cursor.fetchone()
-
-                        if result:
-                            composer_data = json.loads(result[0])
-                            composers = composer_data.get("allComposers", [])
-                            new_composers = []
-                            for c in composers:
-                                cid = c.get("composerId")
-                                if not cid or cid not in seen_composer_ids:
-                                    if cid:
-                                        seen_composer_ids.add(cid)
-                                    new_composers.append(c)
-
-                            if new_composers:
-                                key = folder_path
-                                if key not in by_project:
-                                    by_project[key] = {
-                                        "workspace_id": workspace_dir.name,
-                                        "project_name": project_name,
-                                        "folder_path": folder_path,
-                                        "composers": [],
-                                        "latest_dialog": None,
-                                        "state_db_path": str(state_db),
-                                    }
-                                by_project[key]["composers"].extend(new_composers)
+
+                    new_composers = []
+                    for c in composers:
+                        cid = c.get("composerId")
+                        if not cid or cid not in seen_composer_ids:
+                            if cid:
+                                seen_composer_ids.add(cid)
+                            new_composers.append(c)
+                    seen_composer_ids.update(composer_ids)
+
+                    if new_composers:
+                        key = folder_path
+                        if key not in by_project:
+                            by_project[key] = {
+                                "workspace_id": workspace_dir.name,
+                                "project_name": project_name,
+                                "folder_path": folder_path,
+                                "composers": [],
+                                "latest_dialog": None,
+                                "state_db_path": str(state_db),
+                            }
+                        by_project[key]["composers"].extend(new_composers)
 
                 except Exception:
                     continue
@@ -184,12 +201,34 @@ class CursorChatViewer:
             sort_desc: Sort descending if True
             use_updated: Use last_updated date instead of created_at
         """
-        projects = self.get_projects()
-        all_dialogs = []
+        cache_key = (
+            str(self.global_storage_path),
+            str(self.workspace_storage_path),
+            start_date,
+            end_date,
+            project_filter,
+            sort_by,
+            sort_desc,
+            use_updated,
+        )
+        signature = storage_signature(
+            self.global_storage_path, self.workspace_storage_path
+        )
+        cached = self._dialog_cache.get(cache_key, signature)
+        if cached is not None:
+            return cached
 
         start_ts = int(start_date.timestamp() * 1000) if start_date else None
         end_ts = int(end_date.timestamp() * 1000) if end_date else None
 
+        # The date window is applied in SQL while the composer blobs are read
+        projects = self._collect_projects(
+            "lastUpdatedAt" if use_updated else "createdAt",
+            start_ts or None,
+            end_ts or None,
+        )
+        all_dialogs = []
+
         for project in projects:
             if project_filter:
                 if project_filter.lower() not in project["project_name"].lower():
@@ -198,12 +237,6 @@ class CursorChatViewer:
             for composer in project.get("composers", []):
                 last_updated = composer.get("lastUpdatedAt", 0)
                 created_at = composer.get("createdAt", 0)
-                filter_date = last_updated if use_updated else created_at
-
-                if start_ts and filter_date < start_ts:
-                    continue
-                if end_ts and filter_date > end_ts:
-                    continue
 
                 all_dialogs.append(
                     {
@@ -230,6 +263,7 @@ class CursorChatViewer:
             date_field = "last_updated" if use_updated else "created_at"
             all_dialogs.sort(key=lambda x: x.get(date_field, 0), reverse=sort_desc)
 
+        self._dialog_cache.put(cache_key, signature, all_dialogs)
         return all_dialogs
 
     def list_projects(self):
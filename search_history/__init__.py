@@ -3,7 +3,13 @@ Cursor Chronicle Search - Search through Cursor IDE chat history.
 """
 
 from .cli import main
-from .formatters import format_full_dialog, format_search_results, highlight_query
+from .formatters import (
+    format_full_dialog,
+    format_search_results,
+    highlight_query,
+    stream_full_dialog,
+    stream_search_results,
+)
 from .searcher import CursorHistorySearch
 
 __all__ = [
@@ -11,6 +17,8 @@ __all__ = [
     "main",
     "format_search_results",
     "format_full_dialog",
+    "stream_search_results",
+    "stream_full_dialog",
     "highlight_query",
 ]
 
@@ -5,7 +5,7 @@ Command-line interface for search_history.
 import argparse
 from datetime import datetime
 
-from .formatters import format_full_dialog, format_search_results
+from .formatters import stream_full_dialog, stream_search_results
 from .searcher import CursorHistorySearch
 
 
@@ -89,12 +89,11 @@ def main():
 
         messages = searcher.get_full_dialog(args.show_dialog)
         if messages:
-            output = format_full_dialog(
+            stream_full_dialog(
                 messages,
                 composer.get("name", "Untitled"),
                 composer.get("_project_name", "unknown"),
             )
-            print(output)
         else:
             print("No messages found in dialog.")
         return
@@ -141,14 +140,13 @@ def main():
             print(f"   ID: {dialog['composer_id']}")
             print()
     else:
-        output = format_search_results(
+        stream_search_results(
             results,
             args.query,
             searcher,
             show_context=args.show_context,
             context_size=args.context_size,
         )
-        print(output)
 
 
 if __name__ == "__main__":
@@ -2,32 +2,84 @@
 Output formatting for search results.
 """
 
+import io
 import re
+import sys
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, TextIO
+
+_HL_START = "\033[1;33m"
+_HL_END = "\033[0m"
+_SEP60 = "=" * 60 + "\n"
+_SEP40 = "-" * 40 + "\n"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_ts(ms: int) -> str:
+    """Format a millisecond timestamp as local ``YYYY-MM-DD HH:MM``."""
+    return datetime.fromtimestamp(ms / 1000).strftime("%Y-%m-%d %H:%M")
+
+
+def _highlight_literal(
+    text: str,
+    query: str,
+    q_lower: Optional[str] = None,
+    text_lower: Optional[str] = None,
+) -> str:
+    """Highlight case-insensitive literal occurrences with a ``str.find`` loop."""
+    if not query:
+        return text
+    if q_lower is None:
+        q_lower = query.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+    if len(text_lower) != len(text) or len(q_lower) != len(query):
+        # Case folding changed string length (e.g. "İ"), so offsets in the
+        # lowered copy no longer line up with the original text.
+        pattern = re.compile(f"({re.escape(query)})", re.IGNORECASE)
+        return pattern.sub(_HL_START + r"\1" + _HL_END, text)
+
+    out = []
+    i = 0
+    qlen = len(query)
+    while True:
+        j = text_lower.find(q_lower, i)
+        if j < 0:
+            out.append(text[i:])
+            break
+        out.append(text[i:j])
+        out.append(_HL_START)
+        out.append(text[j : j + qlen])
+        out.append(_HL_END)
+        i = j + qlen
+    return "".join(out)
 
 
 def highlight_query(text: str, query: str) -> str:
     """Highlight query in text using ANSI colors."""
-    pattern = re.compile(f"({re.escape(query)})", re.IGNORECASE)
-    return pattern.sub(r"\033[1;33m\1\033[0m", text)
+    return _highlight_literal(text, query)
 
 
-def format_search_results(
+def stream_search_results(
     results: List[Dict],
     query: str,
     searcher,
     show_context: bool = False,
     context_size: int = 3,
-) -> str:
-    """Format search results for display."""
+    *,
+    out: Optional[TextIO] = None,
+) -> None:
+    """Write formatted search results line by line to ``out`` (stdout by default)."""
+    write = (out if out is not None else sys.stdout).write
     if not results:
-        return f"No results found for '{query}'"
+        write(f"No results found for '{query}'\n")
+        return
 
-    output = []
-    output.append(f"🔍 Search results for '{query}'")
-    output.append(f"   Found {len(results)} match(es)")
-    output.append("=" * 60)
+    query_lower = query.lower()
+    write(f"🔍 Search results for '{query}'\n")
+    write(f"   Found {len(results)} match(es)\n")
+    write(_SEP60)
 
     dialogs = {}
     for result in results:
@@ -45,19 +97,17 @@ def format_search_results(
         dialogs[dialog_key]["matches"].append(result)
 
     for dialog_key, dialog_info in dialogs.items():
-        output.append("")
-        output.append(f"📁 Project: {dialog_info['project_name']}")
-        output.append(f"💬 Dialog: {dialog_info['dialog_name']}")
+        write("\n")
+        write(f"📁 Project: {dialog_info['project_name']}\n")
+        write(f"💬 Dialog: {dialog_info['dialog_name']}\n")
 
         if dialog_info["last_updated"]:
-            date = datetime.fromtimestamp(dialog_info["last_updated"] / 1000)
-            output.append(f"📅 Last updated: {date.strftime('%Y-%m-%d %H:%M')}")
+            write(f"📅 Last updated: {_fmt_ts(dialog_info['last_updated'])}\n")
         if dialog_info["created_at"]:
-            date = datetime.fromtimestamp(dialog_info["created_at"] / 1000)
-            output.append(f"📅 Created: {date.strftime('%Y-%m-%d %H:%M')}")
+            write(f"📅 Created: {_fmt_ts(dialog_info['created_at'])}\n")
 
-        output.append(f"🔗 Composer ID: {dialog_info['composer_id']}")
-        output.append("-" * 40)
+        write(f"🔗 Composer ID: {dialog_info['composer_id']}\n")
+        write(_SEP40)
 
         for match in dialog_info["matches"]:
             field = match.get("field", "unknown")
@@ -73,27 +123,39 @@ def format_search_results(
             if field in ("tool_args", "tool_result"):
                 type_icon = f"🛠️ Tool: {match.get('tool_name', 'unknown')}"
 
-            output.append(f"   {type_icon}")
+            write(f"   {type_icon}\n")
 
-            highlighted = highlight_query(content, query)
-            if len(highlighted) > 500:
-                lower_content = content.lower()
-                lower_query = query.lower()
-                pos = lower_content.find(lower_query)
+            content_lower = content.lower()
+            highlighted = None
+            if len(content) <= 500:
+                highlighted = _highlight_literal(
+                    content, query, query_lower, content_lower
+                )
+            # Content over 500 chars always highlights past the limit, so go
+            # straight to the excerpt around the first match.
+            if highlighted is None or len(highlighted) > 500:
+                pos = content_lower.find(query_lower)
                 if pos != -1:
                     start = max(0, pos - 200)
                     end = min(len(content), pos + len(query) + 200)
-                    highlighted = (
-                        "..." + highlight_query(content[start:end], query) + "..."
+                    # Reuse the lowered slice only while its offsets still
+                    # line up with content; otherwise let the helper redo it.
+                    aligned = len(content_lower) == len(content)
+                    excerpt = _highlight_literal(
+                        content[start:end],
+                        query,
+                        query_lower,
+                        content_lower[start:end] if aligned else None,
                     )
+                    highlighted = "..." + excerpt + "..."
                 else:
-                    highlighted = highlighted[:500] + "..."
+                    highlighted = content[:500] + "..."
 
-            output.append(f"   {highlighted}")
-            output.append("")
+            write(f"   {highlighted}\n")
+            write("\n")
 
         if show_context:
-            output.append("   📜 CONTEXT:")
+            write("   📜 CONTEXT:\n")
             for match in dialog_info["matches"][:1]:
                 context = searcher.get_dialog_context(
                     match["composer_id"],
@@ -109,22 +171,39 @@ def format_search_results(
                         if len(msg["text"]) > 200
                         else msg["text"]
                     )
-                    output.append(f"      {icon}: {text}")
-            output.append("")
+                    write(f"      {icon}: {text}\n")
+            write("\n")
 
-    return "\n".join(output)
 
-
-def format_full_dialog(
-    messages: List[Dict], dialog_name: str, project_name: str
+def format_search_results(
+    results: List[Dict],
+    query: str,
+    searcher,
+    show_context: bool = False,
+    context_size: int = 3,
 ) -> str:
-    """Format full dialog for display."""
-    output = []
-    output.append("=" * 60)
-    output.append(f"PROJECT: {project_name}")
-    output.append(f"DIALOG: {dialog_name}")
-    output.append("=" * 60)
-    output.append("")
+    """Format search results for display."""
+    buffer = io.StringIO()
+    stream_search_results(
+        results, query, searcher, show_context, context_size, out=buffer
+    )
+    return buffer.getvalue()[:-1]
+
+
+def stream_full_dialog(
+    messages: List[Dict],
+    dialog_name: str,
+    project_name: str,
+    *,
+    out: Optional[TextIO] = None,
+) -> None:
+    """Write a formatted full dialog line by line to ``out`` (stdout by default)."""
+    write = (out if out is not None else sys.stdout).write
+    write(_SEP60)
+    write(f"PROJECT: {project_name}\n")
+    write(f"DIALOG: {dialog_name}\n")
+    write(_SEP60)
+    write("\n")
 
     for message in messages:
         msg_type = message.get("type")
@@ -132,25 +211,32 @@ def format_full_dialog(
         tool_data = message.get("tool_data")
 
         if msg_type == 1:
-            output.append("👤 USER:")
+            write("👤 USER:\n")
             if text:
-                output.append(text)
-            output.append("-" * 40)
+                write(text + "\n")
+            write(_SEP40)
         elif msg_type == 2:
             if tool_data:
                 tool_name = tool_data.get("name", "unknown")
                 status = tool_data.get("status", "unknown")
-                output.append(f"🛠️ TOOL: {tool_name} ({status})")
-                output.append("-" * 40)
+                write(f"🛠️ TOOL: {tool_name} ({status})\n")
+                write(_SEP40)
 
             if text:
-                output.append("🤖 AI:")
-                output.append(text)
-                output.append("-" * 40)
+                write("🤖 AI:\n")
+                write(text + "\n")
+                write(_SEP40)
         else:
             if text:
-                output.append(f"📝 MESSAGE (type {msg_type}):")
-                output.append(text)
-                output.append("-" * 40)
+                write(f"📝 MESSAGE (type {msg_type}):\n")
+                write(text + "\n")
+                write(_SEP40)
+
 
-    return "\n".join(output)
+def format_full_dialog(
+    messages: List[Dict], dialog_name: str, project_name: str
+) -> str:
+    """Format full dialog for display."""
+    buffer = io.StringIO()
+    stream_full_dialog(messages, dialog_name, project_name, out=buffer)
+    return buffer.getvalue()[:-1]
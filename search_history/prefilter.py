@@ -0,0 +1,129 @@
+"""
+Raw-value prefilters and storage loaders used by CursorHistorySearch.
+"""
+
+import json
+import re
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from cursor_chronicle.utils import parse_workspace_storage_meta
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency
+    hyperscan = None
+
+
+def build_value_prefilter(query: str, case_sensitive: bool) -> Callable:
+    """Return a predicate telling whether a raw UTF-8 value may contain query."""
+    needle = query.encode("utf-8")
+    if case_sensitive:
+        return lambda value: needle in value
+    if query.isascii():
+        if hyperscan is not None and needle:
+            return _build_hyperscan_prefilter(needle)
+        return re.compile(re.escape(needle), re.IGNORECASE).search
+
+    # Non-ASCII case folding needs str semantics, so decode before matching
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+    return lambda value: pattern.search(value.decode("utf-8", "replace"))
+
+
+def _build_hyperscan_prefilter(needle: bytes) -> Callable:
+    """Case-insensitive ASCII prefilter backed by the optional Hyperscan SIMD engine."""
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(needle)],
+        ids=[0],
+        elements=1,
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH],
+    )
+
+    def matches(value: bytes) -> bool:
+        found = []
+        database.scan(value, match_event_handler=lambda *_: found.append(True))
+        return bool(found)
+
+    return matches
+
+
+@lru_cache(maxsize=64)
+def load_ordered_bubble_ids(
+    db_path: str, db_signature: Tuple, composer_id: str
+) -> Tuple[str, ...]:
+    """Read ordered bubble IDs from composerData.
+
+    ``db_signature`` is only part of the cache key: it changes whenever the
+    database (or its WAL) is written, so stale entries are never returned.
+    """
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """SELECT value FROM cursorDiskKV
+            WHERE key = ? AND LENGTH(value) > 100""",
+            (f"composerData:{composer_id}",),
+        )
+        composer_result = cursor.fetchone()
+
+    if composer_result:
+        try:
+            composer_data = json.loads(composer_result[0])
+            if "fullConversationHeadersOnly" in composer_data:
+                return tuple(
+                    bubble["bubbleId"]
+                    for bubble in composer_data["fullConversationHeadersOnly"]
+                )
+        except json.JSONDecodeError:
+            pass
+    return ()
+
+
+def _db_signature(db_path: Path) -> Tuple:
+    """(mtime_ns, size) of a SQLite file and its WAL sidecar, if present."""
+    wal_path = db_path.with_name(db_path.name + "-wal")
+    return tuple(
+        (st.st_mtime_ns, st.st_size)
+        for st in (path.stat() for path in (db_path, wal_path) if path.exists())
+    )
+
+
+def get_ordered_bubble_ids(db_path: Path, composer_id: str) -> Tuple[str, ...]:
+    """Get the conversation's bubble IDs in display order (may be empty)."""
+    signature = _db_signature(db_path)
+    return load_ordered_bubble_ids(str(db_path), signature, composer_id)
+
+
+def load_workspace_composers(workspace_dir: Path, cache: Dict[str, Tuple]) -> Tuple:
+    """Read (project_name, folder_path, composers) for a workspace dir.
+
+    Results are kept in ``cache`` under the workspace dir name and reused
+    while ``workspace.json``, ``state.vscdb`` and its WAL are unchanged.
+    """
+    workspace_json = workspace_dir / "workspace.json"
+    state_db = workspace_dir / "state.vscdb"
+    json_stat = workspace_json.stat()
+    signature = ((json_stat.st_mtime_ns, json_stat.st_size), _db_signature(state_db))
+
+    cached = cache.get(workspace_dir.name)
+    if cached and cached[0] == signature:
+        return cached[1:]
+
+    with open(workspace_json, "r") as f:
+        workspace_data = json.load(f)
+    project_name, folder_path = parse_workspace_storage_meta(workspace_data)
+
+    composers: List[Dict] = []
+    with sqlite3.connect(state_db) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT value FROM ItemTable WHERE key = 'composer.composerData'"
+        )
+        result = cursor.fetchone()
+        if result:
+            composers = json.loads(result[0]).get("allComposers", [])
+
+    cache[workspace_dir.name] = (signature, project_name, folder_path, composers)
+    return project_name, folder_path, composers
@@ -6,19 +6,26 @@ import json
 import re
 import signal
 import sqlite3
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from cursor_chronicle.utils import (
     get_cursor_paths,
     load_global_composer_headers,
     parse_composer_workspace_identifier,
-    parse_workspace_storage_meta,
+)
+
+from .prefilter import (
+    build_value_prefilter,
+    get_ordered_bubble_ids,
+    load_workspace_composers,
 )
 
 # Handle broken pipe gracefully
 signal.signal(signal.SIGPIPE, signal.SIG_DFL)
 
+# Bubble values at or below this size are stubs without message content
+_MIN_BUBBLE_SIZE = 100
+
 
 class CursorHistorySearch:
     """Search through Cursor IDE chat history."""
@@ -29,6 +36,9 @@ class CursorHistorySearch:
             self.workspace_storage_path,
             self.global_storage_path,
         ) = get_cursor_paths()
+        # workspace dir name -> (storage signature, project_name,
+        #                        folder_path, composers)
+        self._composers_cache: Dict[str, Tuple] = {}
 
     def get_all_composers(self) -> List[Dict]:
         """Get all composers from all workspaces with project info.
@@ -65,32 +75,24 @@ class CursorHistorySearch:
                     continue
 
                 try:
-                    with open(workspace_json, "r") as f:
-                        workspace_data = json.load(f)
-
-                    project_name, folder_path = parse_workspace_storage_meta(
-                        workspace_data
-                    )
-
-                    with sqlite3.connect(state_db) as conn:
-                        cursor = conn.cursor()
-                        cursor.execute(
-                            "SELECT value FROM ItemTable WHERE key = 'composer.composerData'"
-                        )
-                        result = cursor.fetchone()
-
-                        if result:
-                            composer_data = json.loads(result[0])
-                            for comp in composer_data.get("allComposers", []):
-                                cid = comp.get("composerId")
-                                if cid and cid in seen_ids:
-                                    continue
-                                comp["_project_name"] = project_name
-                                comp["_folder_path"] = folder_path
-                                comp["_workspace_id"] = workspace_dir.name
-                                if cid:
-                                    seen_ids.add(cid)
-                                composers.append(comp)
+                    (
+                        project_name,
+                        folder_path,
+                        workspace_composers,
+                    ) = load_workspace_composers(workspace_dir, self._composers_cache)
+
+                    for comp in workspace_composers:
+                        cid = comp.get("composerId")
+                        if cid and cid in seen_ids:
+                            continue
+                        # Annotate a copy so the cached composers stay clean
+                        comp = dict(comp)
+                        comp["_project_name"] = project_name
+                        comp["_folder_path"] = folder_path
+                        comp["_workspace_id"] = workspace_dir.name
+                        if cid:
+                            seen_ids.add(cid)
+                        composers.append(comp)
 
                 except Exception:
                     continue
@@ -162,13 +164,15 @@ class CursorHistorySearch:
             cursor = conn.cursor()
 
             cursor.execute(
-                """SELECT key, value FROM cursorDiskKV
-                WHERE key LIKE ? AND LENGTH(value) > 100""",
+                """SELECT key, CAST(value AS BLOB) FROM cursorDiskKV
+                WHERE key LIKE ?""",
                 (f"bubbleId:{composer_id}:%",),
             )
             results = cursor.fetchall()
 
         for key, value in results:
+            if value is None or len(value) <= _MIN_BUBBLE_SIZE:
+                continue
             try:
                 bubble_data = json.loads(value)
                 bubble_matches = self.search_in_bubble(
@@ -181,7 +185,7 @@ class CursorHistorySearch:
                         match["composer_id"] = composer_id
                     matches.extend(bubble_matches)
 
-            except json.JSONDecodeError:
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 continue
 
         return matches
@@ -221,17 +225,21 @@ class CursorHistorySearch:
         with sqlite3.connect(self.global_storage_path) as conn:
             cursor = conn.cursor()
 
-            flags = 0 if case_sensitive else re.IGNORECASE
-            pattern = re.compile(re.escape(query), flags)
+            value_matches = build_value_prefilter(query, case_sensitive)
 
-            cursor.execute("""SELECT key, value FROM cursorDiskKV
-                WHERE key LIKE 'bubbleId:%' AND LENGTH(value) > 100""")
+            # Values come back as raw bytes so rows rejected by the prefilter
+            # are never decoded; json.loads accepts the UTF-8 bytes directly.
+            cursor.execute("""SELECT key, CAST(value AS BLOB) FROM cursorDiskKV
+                WHERE key LIKE 'bubbleId:%'""")
 
             checked = 0
             for key, value in cursor:
                 checked += 1
                 if checked % 1000 == 0 and verbose:
-                    print(f"  Checked {checked} messages...", file=__import__("sys").stderr)
+                    print(
+                        f"  Checked {checked} messages...",
+                        file=__import__("sys").stderr,
+                    )
 
                 parts = key.split(":")
                 if len(parts) < 2:
@@ -241,7 +249,10 @@ class CursorHistorySearch:
                 if composer_id not in composer_lookup:
                     continue
 
-                if not pattern.search(value):
+                if value is None or len(value) <= _MIN_BUBBLE_SIZE:
+                    continue
+
+                if not value_matches(value):
                     continue
 
                 try:
@@ -255,8 +266,12 @@ class CursorHistorySearch:
                         for match in bubble_matches:
                             match["bubble_id"] = bubble_data.get("bubbleId", "")
                             match["composer_id"] = composer_id
-                            match["project_name"] = composer.get("_project_name", "unknown")
-                            match["folder_path"] = composer.get("_folder_path", "unknown")
+                            match["project_name"] = composer.get(
+                                "_project_name", "unknown"
+                            )
+                            match["folder_path"] = composer.get(
+                                "_folder_path", "unknown"
+                            )
                             match["dialog_name"] = composer.get("name", "Untitled")
                             match["last_updated"] = composer.get("lastUpdatedAt", 0)
                             match["created_at"] = composer.get("createdAt", 0)
@@ -265,7 +280,7 @@ class CursorHistorySearch:
                         if len(all_results) >= limit:
                             break
 
-                except json.JSONDecodeError:
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     continue
 
         if verbose:
@@ -284,40 +299,20 @@ class CursorHistorySearch:
         if not self.global_storage_path.exists():
             return []
 
-        with sqlite3.connect(self.global_storage_path) as conn:
-            cursor = conn.cursor()
+        ordered_bubble_ids = get_ordered_bubble_ids(
+            self.global_storage_path, composer_id
+        )
+        try:
+            target_index = ordered_bubble_ids.index(bubble_id)
+        except ValueError:
+            return []
 
-            cursor.execute(
-                """SELECT value FROM cursorDiskKV
-                WHERE key = ? AND LENGTH(value) > 100""",
-                (f"composerData:{composer_id}",),
-            )
-            composer_result = cursor.fetchone()
+        start = max(0, target_index - context_size)
+        end = min(len(ordered_bubble_ids), target_index + context_size + 1)
+        context_ids = ordered_bubble_ids[start:end]
 
-            ordered_bubble_ids = []
-            if composer_result:
-                try:
-                    composer_data = json.loads(composer_result[0])
-                    if "fullConversationHeadersOnly" in composer_data:
-                        ordered_bubble_ids = [
-                            bubble["bubbleId"]
-                            for bubble in composer_data["fullConversationHeadersOnly"]
-                        ]
-                except json.JSONDecodeError:
-                    pass
-
-            target_index = -1
-            for i, bid in enumerate(ordered_bubble_ids):
-                if bid == bubble_id:
-                    target_index = i
-                    break
-
-            if target_index == -1:
-                return []
-
-            start = max(0, target_index - context_size)
-            end = min(len(ordered_bubble_ids), target_index + context_size + 1)
-            context_ids = ordered_bubble_ids[start:end]
+        with sqlite3.connect(self.global_storage_path) as conn:
+            cursor = conn.cursor()
 
             messages = []
             for bid in context_ids:
@@ -348,28 +343,13 @@ class CursorHistorySearch:
         if not self.global_storage_path.exists():
             return []
 
+        ordered_bubble_ids = get_ordered_bubble_ids(
+            self.global_storage_path, composer_id
+        )
+
         with sqlite3.connect(self.global_storage_path) as conn:
             cursor = conn.cursor()
 
-            cursor.execute(
-                """SELECT value FROM cursorDiskKV
-                WHERE key = ? AND LENGTH(value) > 100""",
-                (f"composerData:{composer_id}",),
-            )
-            composer_result = cursor.fetchone()
-
-            ordered_bubble_ids = []
-            if composer_result:
-                try:
-                    composer_data = json.loads(composer_result[0])
-                    if "fullConversationHeadersOnly" in composer_data:
-                        ordered_bubble_ids = [
-                            bubble["bubbleId"]
-                            for bubble in composer_data["fullConversationHeadersOnly"]
-                        ]
-                except json.JSONDecodeError:
-                    pass
-
             if not ordered_bubble_ids:
                 cursor.execute(
                     """SELECT key, value FROM cursorDiskKV
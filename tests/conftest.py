@@ -4,6 +4,7 @@ Shared test fixtures and utilities for cursor_chronicle tests.
 
 import json
 import os
+import socket
 import sqlite3
 import sys
 import tempfile
@@ -15,6 +16,74 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import cursor_chronicle
+from cursor_chronicle.utils import CURSOR_USER_DIR_ENV
+
+# 2024-01-01 .. 2024-01-03 00:00 UTC, in the milliseconds Cursor stores.
+_HERMETIC_COMPOSERS = [
+    {
+        "composerId": f"demo-{i}",
+        "name": f"Demo dialog {i}",
+        "createdAt": 1704067200000 + i * 86400000,
+        "lastUpdatedAt": 1704067200000 + i * 86400000 + 3600000,
+    }
+    for i in range(3)
+]
+
+
+@pytest.fixture(autouse=True)
+def _block_network(monkeypatch):
+    """Fail fast if a test reaches for the network instead of a mock."""
+
+    def guard(*args, **kwargs):
+        raise RuntimeError("Network access is disabled in tests")
+
+    monkeypatch.setattr(socket.socket, "connect", guard)
+    monkeypatch.setattr(socket.socket, "connect_ex", guard)
+    monkeypatch.setattr(socket, "create_connection", guard)
+
+
+@pytest.fixture(scope="session")
+def cursor_user_dir(tmp_path_factory):
+    """Build a minimal Cursor User directory with one legacy workspace."""
+    user_dir = tmp_path_factory.mktemp("cursor_user")
+    workspace_dir = user_dir / "workspaceStorage" / "demo-hash"
+    workspace_dir.mkdir(parents=True)
+    (workspace_dir / "workspace.json").write_text(
+        json.dumps({"folder": "file:///home/user/demo-project"}), encoding="utf-8"
+    )
+    with sqlite3.connect(workspace_dir / "state.vscdb") as conn:
+        conn.execute("CREATE TABLE ItemTable (key TEXT, value TEXT)")
+        conn.execute(
+            "INSERT INTO ItemTable VALUES (?, ?)",
+            (
+                "composer.composerData",
+                json.dumps({"allComposers": _HERMETIC_COMPOSERS}),
+            ),
+        )
+    (user_dir / "globalStorage").mkdir()
+    with sqlite3.connect(user_dir / "globalStorage" / "state.vscdb") as conn:
+        conn.execute("CREATE TABLE ItemTable (key TEXT, value TEXT)")
+        conn.execute("CREATE TABLE cursorDiskKV (key TEXT, value TEXT)")
+    return user_dir
+
+
+@pytest.fixture
+def hermetic_cursor(cursor_user_dir, monkeypatch):
+    """Point CursorChatViewer at the fixture directory instead of ~/.config."""
+    monkeypatch.setenv(CURSOR_USER_DIR_ENV, str(cursor_user_dir))
+    return cursor_user_dir
+
+
+@pytest.fixture(scope="session")
+def hermetic_viewer(cursor_user_dir):
+    """One CursorChatViewer on the fixture directory, shared by read-only tests.
+
+    Storage paths are resolved in __init__, so the override is only needed
+    while constructing it. Tests that reassign viewer paths build their own.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(CURSOR_USER_DIR_ENV, str(cursor_user_dir))
+        return cursor_chronicle.CursorChatViewer()
 
 
 @pytest.fixture
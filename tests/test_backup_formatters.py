@@ -13,6 +13,13 @@ from cursor_chronicle.backup import (
     format_restore_summary,
 )
 from cursor_chronicle.backup_formatters import _format_size
+from cursor_chronicle.cli import create_parser
+from cursor_chronicle.config import (
+    DEFAULT_BACKUP_PATH,
+    DEFAULT_CONFIG,
+    get_backup_path,
+    load_config,
+)
 
 
 class TestFormatSize(unittest.TestCase):
@@ -172,10 +179,9 @@ class TestFormatRestoreSummary(unittest.TestCase):
 class TestCLIBackupArgs(unittest.TestCase):
     """Test CLI argument parsing for backup commands."""
 
-    def setUp(self):
-        from cursor_chronicle.cli import create_parser
-
-        self.parser = create_parser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = create_parser()
 
     def test_backup_arg(self):
         args = self.parser.parse_args(["--backup"])
@@ -215,25 +221,17 @@ class TestConfigBackupPath(unittest.TestCase):
     """Test backup_path in config module."""
 
     def test_config_has_backup_path(self):
-        from cursor_chronicle.config import DEFAULT_CONFIG
-
         self.assertIn("backup_path", DEFAULT_CONFIG)
 
     def test_get_backup_path_default(self):
-        from cursor_chronicle.config import DEFAULT_BACKUP_PATH, get_backup_path
-
         result = get_backup_path({})
         self.assertEqual(result, DEFAULT_BACKUP_PATH)
 
     def test_get_backup_path_from_config(self):
-        from cursor_chronicle.config import get_backup_path
-
         result = get_backup_path({"backup_path": "/my/backups"})
         self.assertEqual(result, Path("/my/backups"))
 
     def test_load_config_includes_backup_path(self):
-        from cursor_chronicle.config import load_config
-
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = Path(tmpdir) / "config.json"
             config_data = {"backup_path": "/custom/backups"}
@@ -11,7 +11,6 @@ from pathlib import Path
 from unittest.mock import patch
 
 from cursor_chronicle.backup import (
-    BACKUP_META_FILE,
     BACKUP_PREFIX,
     BACKUP_SUFFIX,
     _validate_backup,
@@ -1,326 +1,325 @@
 """Tests for cli.py module - command-line interface."""
 
 import argparse
-import sys
-import unittest
-from io import StringIO
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 import cursor_chronicle
 from cursor_chronicle.cli import (
     _run_export,
     _show_config,
     create_parser,
+    main,
+    parse_date,
     parse_positive_int,
     show_dialog,
 )
 
 
-class TestParseDateFunction(unittest.TestCase):
-    """Test the parse_date helper function."""
+@pytest.fixture(autouse=True)
+def mock_cli_deps(monkeypatch):
+    """Replace the collaborators cli.py imports with mocks for every test."""
+    mocks = SimpleNamespace(
+        get_dialog_messages=MagicMock(),
+        format_dialog=MagicMock(),
+        export_dialogs=MagicMock(),
+        show_export_summary=MagicMock(),
+        ensure_config_exists=MagicMock(),
+        get_config_path=MagicMock(),
+    )
+    for name in (
+        "get_dialog_messages",
+        "format_dialog",
+        "export_dialogs",
+        "show_export_summary",
+        "ensure_config_exists",
+    ):
+        monkeypatch.setattr(f"cursor_chronicle.cli.{name}", getattr(mocks, name))
+    monkeypatch.setattr(
+        "cursor_chronicle.config.get_config_path", mocks.get_config_path
+    )
+    return mocks
+
+
+# --- parse_date ---
+
+
+@pytest.mark.parametrize(
+    "date_str,expected",
+    [
+        ("2024-06-15", datetime(2024, 6, 15)),
+        ("2024-06-15 14:30", datetime(2024, 6, 15, 14, 30)),
+        ("2024-06-15 14:30:45", datetime(2024, 6, 15, 14, 30, 45)),
+        ("15.06.2024", datetime(2024, 6, 15)),
+        ("15/06/2024", datetime(2024, 6, 15)),
+    ],
+)
+def test_parse_date_formats(date_str, expected):
+    assert parse_date(date_str) == expected
 
-    def test_iso_format(self):
-        result = cursor_chronicle.parse_date("2024-06-15")
-        self.assertEqual((result.year, result.month, result.day), (2024, 6, 15))
 
-    def test_with_time(self):
-        result = cursor_chronicle.parse_date("2024-06-15 14:30")
-        self.assertEqual((result.hour, result.minute), (14, 30))
+def test_parse_date_caches_results():
+    assert parse_date("2024-06-15") is parse_date("2024-06-15")
 
-    def test_european_format(self):
-        result = cursor_chronicle.parse_date("15.06.2024")
-        self.assertEqual((result.year, result.month, result.day), (2024, 6, 15))
 
-    def test_invalid_raises(self):
-        with self.assertRaises(argparse.ArgumentTypeError):
-            cursor_chronicle.parse_date("invalid-date")
+def test_parse_date_invalid_raises():
+    with pytest.raises(argparse.ArgumentTypeError, match="Invalid date format"):
+        parse_date("invalid-date")
 
-    def test_slash_format(self):
-        result = cursor_chronicle.parse_date("15/06/2024")
-        self.assertEqual((result.year, result.month, result.day), (2024, 6, 15))
 
-    def test_with_seconds(self):
-        result = cursor_chronicle.parse_date("2024-06-15 14:30:45")
-        self.assertEqual(result.second, 45)
+# --- main ---
 
 
-class TestMainFunction(unittest.TestCase):
-    """Test main function and CLI behavior."""
+def test_main_function_exists():
+    assert callable(main)
+    assert cursor_chronicle.main is main
+    assert cursor_chronicle.parse_date is parse_date
 
-    def test_main_function_exists(self):
-        self.assertTrue(hasattr(cursor_chronicle, "main"))
-        self.assertTrue(callable(cursor_chronicle.main))
 
+# --- create_parser ---
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Build the CLI parser once; parse_args does not mutate it."""
+    return create_parser()
+
+
+def test_create_parser_returns_parser(parser):
+    assert isinstance(parser, argparse.ArgumentParser)
+
+
+@pytest.mark.parametrize(
+    "flag,attr",
+    [
+        ("--export", "export"),
+        ("--show-config", "show_config"),
+        ("--stats", "stats"),
+        ("--list-all", "list_all"),
+    ],
+)
+def test_create_parser_bool_flags(parser, flag, attr):
+    assert getattr(parser.parse_args([flag]), attr) is True
+
+
+def test_create_parser_verbosity_arg(parser):
+    assert parser.parse_args(["--verbosity", "3"]).verbosity == 3
+
+
+def test_create_parser_export_path_arg(parser):
+    args = parser.parse_args(["--export-path", "/tmp/test"])
+    assert args.export_path == "/tmp/test"
+
+
+def test_create_parser_default_values(parser):
+    args = parser.parse_args([])
+    assert args.limit == 50
+    assert args.days == 30
+    assert args.top == 10
+    assert args.max_output_lines == 1
+    assert not args.desc
+    assert not args.updated
+
+
+def test_create_parser_limit_must_be_positive(parser):
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--limit", "0"])
+
+
+def test_create_parser_days_must_be_positive(parser):
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--days", "-1"])
+
+
+def test_create_parser_max_output_lines_must_be_positive(parser):
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--max-output-lines", "0"])
+
+
+# --- parse_positive_int ---
+
+
+def test_parse_positive_int_valid_value():
+    assert parse_positive_int("5") == 5
+
+
+def test_parse_positive_int_invalid_zero():
+    with pytest.raises(argparse.ArgumentTypeError, match="positive integer"):
+        parse_positive_int("0")
+
+
+# --- _show_config ---
+
+
+def test_show_config_output(mock_cli_deps, capsys):
+    mock_cli_deps.ensure_config_exists.return_value = {
+        "export_path": "/test/path",
+        "verbosity": 2,
+    }
+    mock_cli_deps.get_config_path.return_value = Path(
+        "/tmp/.cursor-chronicle/config.json"
+    )
+    _show_config()
+    output = capsys.readouterr().out
+    assert "configuration" in output.lower()
+    assert "/tmp/.cursor-chronicle/config.json" in output
+    assert "/test/path" in output
+    assert "standard" in output
+
+
+# --- _run_export ---
+
+
+def test_run_export_calls_export_dialogs(mock_cli_deps):
+    mock_cli_deps.export_dialogs.return_value = {
+        "total_dialogs": 5,
+        "exported": 5,
+        "errors": 0,
+        "skipped": 0,
+        "export_path": "/tmp/test",
+        "verbosity": 2,
+    }
+    mock_cli_deps.show_export_summary.return_value = "Summary"
+    args = SimpleNamespace(
+        export_path=None, verbosity=None, project=None, start_date=None, end_date=None
+    )
+    viewer = SimpleNamespace()
+    _run_export(args, viewer)
+    mock_cli_deps.export_dialogs.assert_called_once()
+
+
+def test_run_export_with_custom_path(mock_cli_deps):
+    mock_cli_deps.export_dialogs.return_value = {
+        "total_dialogs": 1,
+        "exported": 1,
+        "errors": 0,
+        "skipped": 0,
+        "export_path": "/custom/path",
+        "verbosity": 3,
+    }
+    mock_cli_deps.show_export_summary.return_value = "Summary"
+    args = SimpleNamespace(
+        export_path="/custom/path",
+        verbosity=3,
+        project="myproject",
+        start_date=None,
+        end_date=None,
+    )
+    viewer = SimpleNamespace()
+    _run_export(args, viewer)
+    call_kwargs = mock_cli_deps.export_dialogs.call_args[1]
+    assert call_kwargs["export_path"] == Path("/custom/path")
+    assert call_kwargs["verbosity"] == 3
+    assert call_kwargs["project_filter"] == "myproject"
 
-class TestCreateParser(unittest.TestCase):
-    """Test argument parser creation."""
-
-    def test_returns_parser(self):
-        self.assertIsInstance(create_parser(), argparse.ArgumentParser)
-
-    def test_export_args(self):
-        self.assertTrue(create_parser().parse_args(["--export"]).export)
-
-    def test_verbosity_arg(self):
-        self.assertEqual(create_parser().parse_args(["--verbosity", "3"]).verbosity, 3)
-
-    def test_export_path_arg(self):
-        self.assertEqual(
-            create_parser().parse_args(["--export-path", "/tmp/test"]).export_path,
-            "/tmp/test",
-        )
-
-    def test_show_config_arg(self):
-        self.assertTrue(create_parser().parse_args(["--show-config"]).show_config)
-
-    def test_stats_arg(self):
-        self.assertTrue(create_parser().parse_args(["--stats"]).stats)
-
-    def test_list_all_arg(self):
-        self.assertTrue(create_parser().parse_args(["--list-all"]).list_all)
-
-    def test_default_values(self):
-        args = create_parser().parse_args([])
-        self.assertEqual(args.limit, 50)
-        self.assertEqual(args.days, 30)
-        self.assertEqual(args.top, 10)
-        self.assertEqual(args.max_output_lines, 1)
-        self.assertFalse(args.desc)
-        self.assertFalse(args.updated)
-
-    def test_limit_must_be_positive(self):
-        with self.assertRaises(SystemExit):
-            create_parser().parse_args(["--limit", "0"])
-
-    def test_days_must_be_positive(self):
-        with self.assertRaises(SystemExit):
-            create_parser().parse_args(["--days", "-1"])
-
-    def test_max_output_lines_must_be_positive(self):
-        with self.assertRaises(SystemExit):
-            create_parser().parse_args(["--max-output-lines", "0"])
-
-
-class TestParsePositiveIntFunction(unittest.TestCase):
-    """Test positive integer parser helper."""
-
-    def test_valid_value(self):
-        self.assertEqual(parse_positive_int("5"), 5)
-
-    def test_invalid_zero(self):
-        with self.assertRaises(argparse.ArgumentTypeError):
-            parse_positive_int("0")
-
-
-class TestShowConfig(unittest.TestCase):
-    """Test _show_config function."""
-
-    @patch("cursor_chronicle.config.get_config_path")
-    @patch("cursor_chronicle.cli.ensure_config_exists")
-    def test_output(self, mock_ensure, mock_config_path):
-        mock_ensure.return_value = {"export_path": "/test/path", "verbosity": 2}
-        mock_config_path.return_value = Path("/tmp/.cursor-chronicle/config.json")
-        captured = StringIO()
-        sys.stdout = captured
-        try:
-            _show_config()
-        finally:
-            sys.stdout = sys.__stdout__
-        output = captured.getvalue()
-        self.assertIn("configuration", output.lower())
-        self.assertIn("/tmp/.cursor-chronicle/config.json", output)
-        self.assertIn("/test/path", output)
-        self.assertIn("standard", output)
-
-
-class TestRunExport(unittest.TestCase):
-    """Test _run_export function."""
-
-    @patch("cursor_chronicle.cli.export_dialogs")
-    @patch("cursor_chronicle.cli.show_export_summary")
-    def test_calls_export_dialogs(self, mock_summary, mock_export):
-        mock_export.return_value = {
-            "total_dialogs": 5,
-            "exported": 5,
-            "errors": 0,
-            "skipped": 0,
-            "export_path": "/tmp/test",
-            "verbosity": 2,
-        }
-        mock_summary.return_value = "Summary"
-        args = MagicMock()
-        args.export_path = None
-        args.verbosity = None
-        args.project = None
-        args.start_date = None
-        args.end_date = None
-        viewer = MagicMock()
-        captured = StringIO()
-        sys.stdout = captured
-        try:
-            _run_export(args, viewer)
-        finally:
-            sys.stdout = sys.__stdout__
-        mock_export.assert_called_once()
-
-    @patch("cursor_chronicle.cli.export_dialogs")
-    @patch("cursor_chronicle.cli.show_export_summary")
-    def test_with_custom_path(self, mock_summary, mock_export):
-        mock_export.return_value = {
-            "total_dialogs": 1,
-            "exported": 1,
-            "errors": 0,
-            "skipped": 0,
-            "export_path": "/custom/path",
-            "verbosity": 3,
-        }
-        mock_summary.return_value = "Summary"
-        args = MagicMock()
-        args.export_path = "/custom/path"
-        args.verbosity = 3
-        args.project = "myproject"
-        args.start_date = None
-        args.end_date = None
-        viewer = MagicMock()
-        captured = StringIO()
-        sys.stdout = captured
-        try:
-            _run_export(args, viewer)
-        finally:
-            sys.stdout = sys.__stdout__
-        call_kwargs = mock_export.call_args[1]
-        self.assertEqual(call_kwargs["export_path"], Path("/custom/path"))
-        self.assertEqual(call_kwargs["verbosity"], 3)
-        self.assertEqual(call_kwargs["project_filter"], "myproject")
-
-
-class TestShowDialog(unittest.TestCase):
-    """Test show_dialog function."""
-
-    def _capture_output(self, func, *args, **kwargs):
-        captured = StringIO()
-        sys.stdout = captured
-        try:
-            func(*args, **kwargs)
-        finally:
-            sys.stdout = sys.__stdout__
-        return captured.getvalue()
-
-    def test_no_projects(self):
-        viewer = MagicMock()
-        viewer.get_projects.return_value = []
-        output = self._capture_output(show_dialog, viewer)
-        self.assertIn("No projects found", output)
-
-    def test_project_not_found(self):
-        viewer = MagicMock()
-        viewer.get_projects.return_value = [
-            {"project_name": "other-project", "composers": []}
-        ]
-        output = self._capture_output(show_dialog, viewer, project_name="nonexistent")
-        self.assertIn("not found", output)
 
-    def test_dialog_not_found(self):
-        viewer = MagicMock()
-        viewer.get_projects.return_value = [
+# --- show_dialog ---
+
+_PROJ_WITH_DIALOG = [
+    {
+        "project_name": "test-project",
+        "composers": [
+            {"name": "test-dialog", "composerId": "abc123", "lastUpdatedAt": 1000}
+        ],
+    }
+]
+
+
+@pytest.fixture
+def viewer_factory():
+    """Return a builder for a viewer mock whose get_projects() yields projects."""
+    viewer = MagicMock(spec_set=["get_projects"])
+
+    def build(projects):
+        viewer.get_projects.return_value = projects
+        return viewer
+
+    return build
+
+
+def test_show_dialog_no_projects(capsys, viewer_factory):
+    viewer = viewer_factory([])
+    show_dialog(viewer)
+    output = capsys.readouterr().out
+    assert "No projects found" in output
+
+
+def test_show_dialog_project_not_found(capsys, viewer_factory):
+    viewer = viewer_factory([{"project_name": "other-project", "composers": []}])
+    show_dialog(viewer, project_name="nonexistent")
+    output = capsys.readouterr().out
+    assert "not found" in output
+
+
+def test_show_dialog_dialog_not_found(capsys, viewer_factory):
+    viewer = viewer_factory(
+        [
             {
                 "project_name": "test-project",
                 "composers": [{"name": "other-dialog", "composerId": "123"}],
             }
         ]
-        output = self._capture_output(
-            show_dialog, viewer, project_name="test-project", dialog_name="nonexistent"
-        )
-        self.assertIn("not found", output)
-
-    def test_no_composers(self):
-        viewer = MagicMock()
-        viewer.get_projects.return_value = [
-            {"project_name": "empty-project", "composers": []}
-        ]
-        output = self._capture_output(show_dialog, viewer, project_name="empty-project")
-        self.assertIn("No dialogs found", output)
+    )
+    show_dialog(viewer, project_name="test-project", dialog_name="nonexistent")
+    output = capsys.readouterr().out
+    assert "not found" in output
 
-    def test_no_composer_id(self):
-        viewer = MagicMock()
-        viewer.get_projects.return_value = [
+
+def test_show_dialog_no_composers(capsys, viewer_factory):
+    viewer = viewer_factory([{"project_name": "empty-project", "composers": []}])
+    show_dialog(viewer, project_name="empty-project")
+    output = capsys.readouterr().out
+    assert "No dialogs found" in output
+
+
+def test_show_dialog_no_composer_id(capsys, viewer_factory):
+    viewer = viewer_factory(
+        [
             {
                 "project_name": "test-project",
                 "composers": [{"name": "test-dialog", "lastUpdatedAt": 1000}],
             }
         ]
-        output = self._capture_output(show_dialog, viewer, project_name="test-project")
-        self.assertIn("ID not found", output)
-
-    @patch("cursor_chronicle.cli.get_dialog_messages")
-    def test_no_messages(self, mock_get_messages):
-        mock_get_messages.return_value = []
-        viewer = MagicMock()
-        viewer.get_projects.return_value = [
-            {
-                "project_name": "test-project",
-                "composers": [
-                    {
-                        "name": "test-dialog",
-                        "composerId": "abc123",
-                        "lastUpdatedAt": 1000,
-                    }
-                ],
-            }
-        ]
-        output = self._capture_output(show_dialog, viewer, project_name="test-project")
-        self.assertIn("No messages found", output)
-
-    @patch("cursor_chronicle.cli.get_dialog_messages")
-    def test_error_handling(self, mock_get_messages):
-        mock_get_messages.side_effect = Exception("Database error")
-        viewer = MagicMock()
-        viewer.get_projects.return_value = [
-            {
-                "project_name": "test-project",
-                "composers": [
-                    {
-                        "name": "test-dialog",
-                        "composerId": "abc123",
-                        "lastUpdatedAt": 1000,
-                    }
-                ],
-            }
-        ]
-        output = self._capture_output(show_dialog, viewer, project_name="test-project")
-        self.assertIn("Error reading dialog", output)
-
-    @patch("cursor_chronicle.cli.get_dialog_messages")
-    @patch("cursor_chronicle.cli.format_dialog")
-    def test_success(self, mock_format, mock_get_messages):
-        mock_get_messages.return_value = [{"type": 1, "text": "Hello"}]
-        mock_format.return_value = "Formatted dialog output"
-        viewer = MagicMock()
-        viewer.get_projects.return_value = [
-            {
-                "project_name": "test-project",
-                "composers": [
-                    {
-                        "name": "test-dialog",
-                        "composerId": "abc123",
-                        "lastUpdatedAt": 1000,
-                    }
-                ],
-            }
-        ]
-        output = self._capture_output(show_dialog, viewer, project_name="test-project")
-        self.assertIn("Formatted dialog output", output)
-
-    @patch("cursor_chronicle.cli.get_dialog_messages")
-    @patch("cursor_chronicle.cli.format_dialog")
-    def test_finds_by_partial_name(self, mock_format, mock_get_messages):
-        mock_get_messages.return_value = [{"type": 1, "text": "Hello"}]
-        mock_format.return_value = "Output"
-        viewer = MagicMock()
-        viewer.get_projects.return_value = [
+    )
+    show_dialog(viewer, project_name="test-project")
+    output = capsys.readouterr().out
+    assert "ID not found" in output
+
+
+def test_show_dialog_no_messages(mock_cli_deps, capsys, viewer_factory):
+    mock_cli_deps.get_dialog_messages.return_value = []
+    viewer = viewer_factory(_PROJ_WITH_DIALOG)
+    show_dialog(viewer, project_name="test-project")
+    output = capsys.readouterr().out
+    assert "No messages found" in output
+
+
+def test_show_dialog_error_handling(mock_cli_deps, capsys, viewer_factory):
+    mock_cli_deps.get_dialog_messages.side_effect = Exception("Database error")
+    viewer = viewer_factory(_PROJ_WITH_DIALOG)
+    show_dialog(viewer, project_name="test-project")
+    output = capsys.readouterr().out
+    assert "Error reading dialog" in output
+
+
+def test_show_dialog_success(mock_cli_deps, capsys, viewer_factory):
+    mock_cli_deps.get_dialog_messages.return_value = [{"type": 1, "text": "Hello"}]
+    mock_cli_deps.format_dialog.return_value = "Formatted dialog output"
+    viewer = viewer_factory(_PROJ_WITH_DIALOG)
+    show_dialog(viewer, project_name="test-project")
+    output = capsys.readouterr().out
+    assert "Formatted dialog output" in output
+
+
+def test_show_dialog_finds_by_partial_name(mock_cli_deps, viewer_factory):
+    mock_cli_deps.get_dialog_messages.return_value = [{"type": 1, "text": "Hello"}]
+    mock_cli_deps.format_dialog.return_value = "Output"
+    viewer = viewer_factory(
+        [
             {
                 "project_name": "test-project",
                 "composers": [
@@ -332,11 +331,6 @@ class TestShowDialog(unittest.TestCase):
                 ],
             }
         ]
-        self._capture_output(
-            show_dialog, viewer, project_name="test", dialog_name="long dialog"
-        )
-        mock_get_messages.assert_called_once()
-
-
-if __name__ == "__main__":
-    unittest.main()
+    )
+    show_dialog(viewer, project_name="test", dialog_name="long dialog")
+    mock_cli_deps.get_dialog_messages.assert_called_once()
@@ -4,12 +4,12 @@ Tests for config.py module - configuration management.
 
 import json
 import os
-import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import mock_open, patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from cursor_chronicle.config import (
     DEFAULT_CONFIG,
@@ -24,192 +24,205 @@ from cursor_chronicle.config import (
     save_config,
 )
 
+# RAM-backed temp root on Linux keeps config fixture I/O off the disk
+_TMPROOT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
 
-class TestLoadConfig(unittest.TestCase):
+# Pre-serialized config fixtures
+_FIXTURE_CUSTOM = b'{"export_path": "/custom/path", "verbosity": 3}'
+_FIXTURE_PARTIAL = b'{"verbosity": 1}'
+_FIXTURE_BAD = b"not valid json {{{"
+_FIXTURE_LIST = b"[1, 2, 3]"
+_FIXTURE_EXTRA = b'{"export_path": "/custom", "verbosity": 1, "unknown_key": "value"}'
+_FIXTURE_EXISTING = b'{"export_path": "/custom", "verbosity": 3}'
+
+
+def _write_bytes(path, data):
+    """Write raw bytes to path without the buffered file object layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _load_from_memory(data):
+    """Run load_config on in-memory file contents; None means no file exists."""
+    read_data = data.decode() if data is not None else ""
+    with patch.object(Path, "exists", return_value=data is not None), patch(
+        "cursor_chronicle.config.open", mock_open(read_data=read_data), create=True
+    ):
+        return load_config(Path("/nonexistent/config.json"))
+
+
+def _load(path):
+    """Read JSON from path."""
+    return json.loads(path.read_text())
+
+
+class _TempDirTestCase(unittest.TestCase):
+    """Share one temporary directory across all tests of a class."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory(prefix="cc_cfg_", dir=_TMPROOT)
+        cls.tmpdir = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        # Per-test file name keeps tests isolated inside the shared directory
+        self.config_path = self.tmpdir / f"{self._testMethodName}.json"
+
+
+class TestLoadConfig(_TempDirTestCase):
     """Test load_config function."""
 
+    # File contents each test reads, keyed by test method name
+    FIXTURES = {
+        "test_load_config_valid_file": _FIXTURE_CUSTOM,
+        "test_load_config_partial_file": _FIXTURE_PARTIAL,
+        "test_load_config_extra_keys_ignored": _FIXTURE_EXTRA,
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Create all fixture files in one pass before any test runs
+        for name, data in cls.FIXTURES.items():
+            _write_bytes(cls.tmpdir / f"{name}.json", data)
+
     def test_load_config_no_file(self):
         """Test loading config when file doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "nonexistent" / "config.json"
-            config = load_config(config_path)
-            self.assertEqual(config["export_path"], str(DEFAULT_EXPORT_PATH))
-            self.assertEqual(config["verbosity"], VERBOSITY_STANDARD)
+        config = _load_from_memory(None)
+        assert config["export_path"] == str(DEFAULT_EXPORT_PATH)
+        assert config["verbosity"] == VERBOSITY_STANDARD
+
+    def test_default_config_is_read_only(self):
+        """Test DEFAULT_CONFIG cannot be mutated through load_config results."""
+        with pytest.raises(TypeError):
+            DEFAULT_CONFIG["verbosity"] = VERBOSITY_FULL
+        config = load_config(self.tmpdir / "missing.json")
+        config["verbosity"] = VERBOSITY_FULL
+        assert DEFAULT_CONFIG["verbosity"] == VERBOSITY_STANDARD
 
     def test_load_config_valid_file(self):
         """Test loading config from a valid file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            config_data = {"export_path": "/custom/path", "verbosity": 3}
-            with open(config_path, "w") as f:
-                json.dump(config_data, f)
-
-            config = load_config(config_path)
-            self.assertEqual(config["export_path"], "/custom/path")
-            self.assertEqual(config["verbosity"], 3)
+        config = load_config(self.config_path)
+        assert config["export_path"] == "/custom/path"
+        assert config["verbosity"] == 3
 
     def test_load_config_partial_file(self):
         """Test loading config with only some keys."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            config_data = {"verbosity": 1}
-            with open(config_path, "w") as f:
-                json.dump(config_data, f)
-
-            config = load_config(config_path)
-            self.assertEqual(config["export_path"], str(DEFAULT_EXPORT_PATH))
-            self.assertEqual(config["verbosity"], 1)
+        config = load_config(self.config_path)
+        assert config["export_path"] == str(DEFAULT_EXPORT_PATH)
+        assert config["verbosity"] == 1
 
     def test_load_config_invalid_json(self):
         """Test loading config with invalid JSON."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            with open(config_path, "w") as f:
-                f.write("not valid json {{{")
-
-            config = load_config(config_path)
-            self.assertEqual(config, DEFAULT_CONFIG)
+        config = _load_from_memory(_FIXTURE_BAD)
+        assert config is not DEFAULT_CONFIG
+        assert config == DEFAULT_CONFIG
 
     def test_load_config_not_a_dict(self):
         """Test loading config where JSON is not a dict."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            with open(config_path, "w") as f:
-                json.dump([1, 2, 3], f)
-
-            config = load_config(config_path)
-            self.assertEqual(config, DEFAULT_CONFIG)
+        config = _load_from_memory(_FIXTURE_LIST)
+        assert config is not DEFAULT_CONFIG
+        assert config == DEFAULT_CONFIG
 
     def test_load_config_extra_keys_ignored(self):
         """Test that extra keys in config file are ignored."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            config_data = {
-                "export_path": "/custom",
-                "verbosity": 1,
-                "unknown_key": "value",
-            }
-            with open(config_path, "w") as f:
-                json.dump(config_data, f)
-
-            config = load_config(config_path)
-            self.assertEqual(config["export_path"], "/custom")
-            self.assertNotIn("unknown_key", config)
-
-
-class TestSaveConfig(unittest.TestCase):
+        config = load_config(self.config_path)
+        assert config["export_path"] == "/custom"
+        assert config["verbosity"] == 1
+        assert "unknown_key" not in config
+
+
+class TestSaveConfig(_TempDirTestCase):
     """Test save_config function."""
 
     def test_save_config_creates_file(self):
         """Test that save_config creates the config file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            config = {"export_path": "/test/path", "verbosity": 2}
-            save_config(config, config_path)
+        config = {"export_path": "/test/path", "verbosity": 2}
+        save_config(config, self.config_path)
 
-            self.assertTrue(config_path.exists())
-            with open(config_path) as f:
-                saved = json.load(f)
-            self.assertEqual(saved["export_path"], "/test/path")
+        assert self.config_path.exists()
+        saved = _load(self.config_path)
+        assert saved["export_path"] == "/test/path"
 
     def test_save_config_creates_parent_dirs(self):
         """Test that save_config creates parent directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "sub" / "dir" / "config.json"
-            save_config(DEFAULT_CONFIG, config_path)
-            self.assertTrue(config_path.exists())
+        config_path = self.tmpdir / "sub" / "dir" / "config.json"
+        save_config(DEFAULT_CONFIG, config_path)
+        assert config_path.exists()
 
     def test_save_config_overwrites(self):
         """Test that save_config overwrites existing file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            save_config({"export_path": "/first", "verbosity": 1}, config_path)
-            save_config({"export_path": "/second", "verbosity": 3}, config_path)
+        save_config({"export_path": "/first", "verbosity": 1}, self.config_path)
+        save_config({"export_path": "/second", "verbosity": 3}, self.config_path)
 
-            with open(config_path) as f:
-                saved = json.load(f)
-            self.assertEqual(saved["export_path"], "/second")
-            self.assertEqual(saved["verbosity"], 3)
+        saved = _load(self.config_path)
+        assert saved["export_path"] == "/second"
+        assert saved["verbosity"] == 3
 
 
-class TestEnsureConfigExists(unittest.TestCase):
+class TestEnsureConfigExists(_TempDirTestCase):
     """Test ensure_config_exists function."""
 
     def test_creates_config_if_missing(self):
         """Test that config file is created when missing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            config = ensure_config_exists(config_path)
+        config = ensure_config_exists(self.config_path)
 
-            self.assertTrue(config_path.exists())
-            self.assertEqual(config["export_path"], str(DEFAULT_EXPORT_PATH))
+        assert self.config_path.exists()
+        assert config["export_path"] == str(DEFAULT_EXPORT_PATH)
 
     def test_loads_existing_config(self):
         """Test that existing config is loaded without overwriting."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            with open(config_path, "w") as f:
-                json.dump({"export_path": "/custom", "verbosity": 3}, f)
-
-            config = ensure_config_exists(config_path)
-            self.assertEqual(config["export_path"], "/custom")
-            self.assertEqual(config["verbosity"], 3)
-
-
-class TestGetExportPath(unittest.TestCase):
-    """Test get_export_path function."""
-
-    def test_from_config_dict(self):
-        """Test getting export path from config dict."""
-        config = {"export_path": "/my/export/path"}
-        result = get_export_path(config)
-        self.assertEqual(result, Path("/my/export/path"))
+        _write_bytes(self.config_path, _FIXTURE_EXISTING)
 
-    def test_default_when_missing(self):
-        """Test default export path when key is missing."""
-        result = get_export_path({})
-        self.assertEqual(result, DEFAULT_EXPORT_PATH)
+        config = ensure_config_exists(self.config_path)
+        assert config["export_path"] == "/custom"
+        assert config["verbosity"] == 3
 
 
-class TestGetVerbosity(unittest.TestCase):
-    """Test get_verbosity function."""
-
-    def test_valid_verbosity(self):
-        """Test getting valid verbosity levels."""
-        self.assertEqual(get_verbosity({"verbosity": 1}), VERBOSITY_COMPACT)
-        self.assertEqual(get_verbosity({"verbosity": 2}), VERBOSITY_STANDARD)
-        self.assertEqual(get_verbosity({"verbosity": 3}), VERBOSITY_FULL)
-
-    def test_invalid_verbosity_too_low(self):
-        """Test that invalid low verbosity returns default."""
-        self.assertEqual(get_verbosity({"verbosity": 0}), VERBOSITY_STANDARD)
-
-    def test_invalid_verbosity_too_high(self):
-        """Test that invalid high verbosity returns default."""
-        self.assertEqual(get_verbosity({"verbosity": 5}), VERBOSITY_STANDARD)
-
-    def test_invalid_verbosity_not_int(self):
-        """Test that non-int verbosity returns default."""
-        self.assertEqual(get_verbosity({"verbosity": "high"}), VERBOSITY_STANDARD)
-
-    def test_missing_verbosity(self):
-        """Test default when verbosity key is missing."""
-        self.assertEqual(get_verbosity({}), VERBOSITY_STANDARD)
+@pytest.mark.parametrize(
+    "cfg,expected",
+    [
+        ({"export_path": "/my/export/path"}, Path("/my/export/path")),
+        ({}, DEFAULT_EXPORT_PATH),
+    ],
+)
+def test_get_export_path(cfg, expected):
+    assert get_export_path(cfg) == expected
+
+
+@pytest.mark.parametrize(
+    "cfg,expected",
+    [
+        ({"verbosity": 1}, VERBOSITY_COMPACT),
+        ({"verbosity": 2}, VERBOSITY_STANDARD),
+        ({"verbosity": 3}, VERBOSITY_FULL),
+        ({"verbosity": 0}, VERBOSITY_STANDARD),
+        ({"verbosity": 5}, VERBOSITY_STANDARD),
+        ({"verbosity": "high"}, VERBOSITY_STANDARD),
+        ({}, VERBOSITY_STANDARD),
+    ],
+)
+def test_get_verbosity(cfg, expected):
+    assert get_verbosity(cfg) == expected
 
 
-class TestVerbosityConstants(unittest.TestCase):
-    """Test verbosity level constants."""
+@pytest.mark.parametrize(
+    "constant,expected",
+    [(VERBOSITY_COMPACT, 1), (VERBOSITY_STANDARD, 2), (VERBOSITY_FULL, 3)],
+)
+def test_verbosity_values(constant, expected):
+    assert constant == expected
 
-    def test_verbosity_values(self):
-        """Test that verbosity constants have expected values."""
-        self.assertEqual(VERBOSITY_COMPACT, 1)
-        self.assertEqual(VERBOSITY_STANDARD, 2)
-        self.assertEqual(VERBOSITY_FULL, 3)
 
-    def test_verbosity_ordering(self):
-        """Test that verbosity levels are ordered."""
-        self.assertLess(VERBOSITY_COMPACT, VERBOSITY_STANDARD)
-        self.assertLess(VERBOSITY_STANDARD, VERBOSITY_FULL)
+def test_verbosity_ordering():
+    assert VERBOSITY_COMPACT < VERBOSITY_STANDARD < VERBOSITY_FULL
 
 
 if __name__ == "__main__":
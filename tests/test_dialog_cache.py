@@ -0,0 +1,42 @@
+"""
+Tests for dialog_cache.py module - get_all_dialogs result cache.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from cursor_chronicle.dialog_cache import DialogCache, storage_signature
+
+
+class TestDialogCache(unittest.TestCase):
+    """Test the bounded LRU used by CursorChatViewer.get_all_dialogs."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the cache never grows past max_entries."""
+        cache = DialogCache(max_entries=2)
+        cache.put("a", (), [{"name": "a"}])
+        cache.put("b", (), [{"name": "b"}])
+        self.assertIsNotNone(cache.get("a", ()))
+        cache.put("c", (), [{"name": "c"}])
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b", ()))
+        self.assertEqual(cache.get("a", ()), [{"name": "a"}])
+
+    def test_stale_signature_misses(self):
+        """Test an entry built from other storage state is not returned."""
+        cache = DialogCache()
+        cache.put("a", (("db", 1, 10),), [{"name": "a"}])
+        self.assertIsNone(cache.get("a", (("db", 2, 10),)))
+
+    def test_storage_signature_skips_missing_files(self):
+        """Test only files that exist are part of the signature."""
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "state.vscdb"
+            db_path.write_bytes(b"x")
+            signature = storage_signature(db_path, Path(tmp) / "missing")
+        self.assertEqual([entry[0] for entry in signature], [str(db_path)])
+
+
+if __name__ == "__main__":
+    unittest.main()
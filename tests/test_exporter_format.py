@@ -2,7 +2,6 @@
 Tests for exporter.py module - Message and dialog formatting functions.
 """
 
-import json
 import sys
 import unittest
 from pathlib import Path
@@ -4,19 +4,21 @@ Integration tests for cursor_chronicle module
 Tests against real local Cursor databases without mocks
 """
 
-import os
-import sqlite3
 import sys
 import unittest
 from io import StringIO
 from pathlib import Path
 from unittest import mock
 
+import pytest
+
 # Add parent directory to path to import cursor_chronicle
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import cursor_chronicle
 
+pytestmark = pytest.mark.integration
+
 
 class TestCursorChronicleIntegration(unittest.TestCase):
     """Integration tests for cursor_chronicle using real local databases"""
@@ -3,13 +3,13 @@ Tests for messages.py module - message extraction and attached files.
 """
 
 import json
-import os
 import sqlite3
 import sys
-import tempfile
 import unittest
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import cursor_chronicle
@@ -29,16 +29,32 @@ class TestExtractFilesFromLayout(unittest.TestCase):
             "src": {"main.py": None, "utils.py": None, "tests": {"test_main.py": None}},
             "README.md": None,
         }
-        files = cursor_chronicle.extract_files_from_layout(layout)
         expected_files = [
             "src/main.py",
             "src/utils.py",
             "src/tests/test_main.py",
             "README.md",
         ]
-        files.sort()
-        expected_files.sort()
-        self.assertEqual(files, expected_files)
+        self.assertCountEqual(
+            cursor_chronicle.extract_files_from_layout(layout), expected_files
+        )
+
+    def test_extract_files_from_layout_keeps_depth_first_order(self):
+        """Test paths follow key order, ignore non-None leaves and honour prefix."""
+        layout = {"a": {"b": {"c.py": None}, "d.py": None, "meta": 1}, "e.py": None}
+        self.assertEqual(
+            cursor_chronicle.extract_files_from_layout(layout, "root"),
+            ["root/a/b/c.py", "root/a/d.py", "root/e.py"],
+        )
+
+    def test_extract_files_from_layout_deep_nesting(self):
+        """Test layouts deeper than the recursion limit are walked."""
+        depth = sys.getrecursionlimit() + 100
+        layout = {"leaf.py": None}
+        for _ in range(depth):
+            layout = {"d": layout}
+        result = cursor_chronicle.extract_files_from_layout(layout)
+        self.assertEqual(result, ["/".join(["d"] * depth + ["leaf.py"])])
 
 
 class TestExtractAttachedFiles(unittest.TestCase):
@@ -173,188 +189,132 @@ class TestExtractAttachedFiles(unittest.TestCase):
         self.assertEqual(result[0]["type"], "selected_context")
 
 
-class TestGetDialogMessages(unittest.TestCase):
-    """Test get_dialog_messages function edge cases."""
+# --- get_dialog_messages ---
 
-    def test_get_dialog_messages_thinking_bubble(self):
-        """Test thinking bubble detection."""
-        with tempfile.NamedTemporaryFile(suffix=".vscdb", delete=False) as f:
-            db_path = f.name
 
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("CREATE TABLE cursorDiskKV (key TEXT, value TEXT)")
+@pytest.fixture(scope="module")
+def _dialog_db(tmp_path_factory):
+    """One cursorDiskKV database file shared by the get_dialog_messages tests."""
+    db_path = tmp_path_factory.mktemp("dialog_db") / "state.vscdb"
+    conn = sqlite3.connect(db_path)
+    # Durability is irrelevant for fixtures; skip the journal file and fsyncs
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("CREATE TABLE cursorDiskKV (key TEXT, value TEXT)")
+    yield db_path, conn
+    conn.close()
 
-        composer_data = {"fullConversationHeadersOnly": [{"bubbleId": "bubble1"}]}
-        cursor.execute(
-            "INSERT INTO cursorDiskKV VALUES (?, ?)",
-            ("composerData:test123", json.dumps(composer_data)),
-        )
 
-        bubble_data = {
-            "bubbleId": "bubble1",
-            "type": 2,
-            "text": "",
-            "isThought": True,
-            "thinkingDurationMs": 3000,
-            "thinking": {"content": "Thinking about the problem..."},
-        }
-        cursor.execute(
-            "INSERT INTO cursorDiskKV VALUES (?, ?)",
-            ("bubbleId:test123:bubble1", json.dumps(bubble_data)),
-        )
+@pytest.fixture
+def dialog_messages(_dialog_db):
+    """Return a loader that writes cursorDiskKV rows and reads dialog test123 back."""
+    db_path, conn = _dialog_db
+    conn.execute("DELETE FROM cursorDiskKV")
 
-        conn.commit()
-        conn.close()
-
-        try:
-            messages = cursor_chronicle.get_dialog_messages(
-                "test123", db_path=Path(db_path)
-            )
-            self.assertEqual(len(messages), 1)
-            self.assertTrue(messages[0]["is_thought"])
-            self.assertEqual(messages[0]["thinking_duration"], 3000)
-            self.assertIn("Thinking about", messages[0]["thinking_content"])
-        finally:
-            os.unlink(db_path)
-
-    def test_get_dialog_messages_thinking_string(self):
-        """Test thinking as string."""
-        with tempfile.NamedTemporaryFile(suffix=".vscdb", delete=False) as f:
-            db_path = f.name
-
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("CREATE TABLE cursorDiskKV (key TEXT, value TEXT)")
-
-        composer_data = {"fullConversationHeadersOnly": [{"bubbleId": "bubble1"}]}
-        cursor.execute(
+    def load(rows):
+        conn.executemany(
             "INSERT INTO cursorDiskKV VALUES (?, ?)",
-            ("composerData:test123", json.dumps(composer_data)),
+            [
+                (key, value if isinstance(value, str) else json.dumps(value))
+                for key, value in rows.items()
+            ],
         )
-
-        bubble_data = {
-            "bubbleId": "bubble1",
-            "type": 2,
-            "text": "",
-            "thinking": "Direct thinking string" + " " * 100,
-        }
-        cursor.execute(
-            "INSERT INTO cursorDiskKV VALUES (?, ?)",
-            ("bubbleId:test123:bubble1", json.dumps(bubble_data)),
-        )
-
         conn.commit()
-        conn.close()
-
-        try:
-            messages = cursor_chronicle.get_dialog_messages(
-                "test123", db_path=Path(db_path)
-            )
-            self.assertEqual(len(messages), 1)
-            self.assertTrue(messages[0]["is_thought"])
-            self.assertIn("Direct thinking string", messages[0]["thinking_content"])
-        finally:
-            os.unlink(db_path)
-
-    def test_get_dialog_messages_no_full_conversation(self):
-        """Test when no fullConversationHeadersOnly exists."""
-        with tempfile.NamedTemporaryFile(suffix=".vscdb", delete=False) as f:
-            db_path = f.name
-
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("CREATE TABLE cursorDiskKV (key TEXT, value TEXT)")
-
-        composer_data = {"padding": "x" * 100}
-        cursor.execute(
-            "INSERT INTO cursorDiskKV VALUES (?, ?)",
-            ("composerData:test123", json.dumps(composer_data)),
-        )
-
-        bubble_data = {"bubbleId": "bubble1", "type": 1, "text": "Hello " + "x" * 100}
-        cursor.execute(
-            "INSERT INTO cursorDiskKV VALUES (?, ?)",
-            ("bubbleId:test123:bubble1", json.dumps(bubble_data)),
-        )
-
-        conn.commit()
-        conn.close()
-
-        try:
-            messages = cursor_chronicle.get_dialog_messages(
-                "test123", db_path=Path(db_path)
-            )
-            self.assertEqual(len(messages), 1)
-        finally:
-            os.unlink(db_path)
-
-    def test_get_dialog_messages_json_decode_error(self):
-        """Test handling of JSON decode error in bubble."""
-        with tempfile.NamedTemporaryFile(suffix=".vscdb", delete=False) as f:
-            db_path = f.name
-
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("CREATE TABLE cursorDiskKV (key TEXT, value TEXT)")
-
-        cursor.execute(
-            "INSERT INTO cursorDiskKV VALUES (?, ?)",
-            ("bubbleId:test123:bubble1", "invalid json " + "x" * 100),
-        )
-
-        conn.commit()
-        conn.close()
-
-        try:
-            messages = cursor_chronicle.get_dialog_messages(
-                "test123", db_path=Path(db_path)
-            )
-            self.assertEqual(len(messages), 0)
-        finally:
-            os.unlink(db_path)
-
-    def test_thinking_bubble_base64_signature(self):
-        """Test thinking bubble with base64-like signature is handled."""
-        with tempfile.NamedTemporaryFile(suffix=".vscdb", delete=False) as f:
-            db_path = f.name
-
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("CREATE TABLE cursorDiskKV (key TEXT, value TEXT)")
-
-        composer_data = {
-            "fullConversationHeadersOnly": [{"bubbleId": "bubble1"}],
-            "padding": "x" * 100,
+        return cursor_chronicle.get_dialog_messages("test123", db_path=db_path)
+
+    return load
+
+
+def test_get_dialog_messages_thinking_bubble(dialog_messages):
+    messages = dialog_messages(
+        {
+            "composerData:test123": {
+                "fullConversationHeadersOnly": [{"bubbleId": "bubble1"}]
+            },
+            "bubbleId:test123:bubble1": {
+                "bubbleId": "bubble1",
+                "type": 2,
+                "text": "",
+                "isThought": True,
+                "thinkingDurationMs": 3000,
+                "thinking": {"content": "Thinking about the problem..."},
+            },
         }
-        cursor.execute(
-            "INSERT INTO cursorDiskKV VALUES (?, ?)",
-            ("composerData:test123", json.dumps(composer_data)),
-        )
-
-        bubble_data = {
-            "bubbleId": "bubble1",
-            "type": 2,
-            "text": "",
-            "isThought": True,
-            "thinking": {"signature": "AVSoXOInvalidBase64Data" + "x" * 100},
+    )
+    assert [m["is_thought"] for m in messages] == [True]
+    assert messages[0]["thinking_duration"] == 3000
+    assert "Thinking about" in messages[0]["thinking_content"]
+
+
+def test_get_dialog_messages_thinking_string(dialog_messages):
+    messages = dialog_messages(
+        {
+            "composerData:test123": {
+                "fullConversationHeadersOnly": [{"bubbleId": "bubble1"}]
+            },
+            "bubbleId:test123:bubble1": {
+                "bubbleId": "bubble1",
+                "type": 2,
+                "text": "",
+                "thinking": "Direct thinking string" + " " * 100,
+            },
         }
-        cursor.execute(
-            "INSERT INTO cursorDiskKV VALUES (?, ?)",
-            ("bubbleId:test123:bubble1", json.dumps(bubble_data)),
-        )
-
-        conn.commit()
-        conn.close()
-
-        try:
-            messages = cursor_chronicle.get_dialog_messages(
-                "test123", db_path=Path(db_path)
-            )
-            self.assertEqual(len(messages), 1)
-            self.assertTrue(messages[0]["is_thought"])
-        finally:
-            os.unlink(db_path)
+    )
+    assert [m["is_thought"] for m in messages] == [True]
+    assert "Direct thinking string" in messages[0]["thinking_content"]
+
+
+# get_dialog_messages skips cursorDiskKV values of 100 characters or fewer
+_PAD100 = "x" * 100
+_BAD_JSON = "invalid json " + _PAD100
+
+# (label, cursorDiskKV rows, expected is_thought flag of each parsed message)
+_BUBBLE_SCENARIOS = [
+    (
+        "no_full_conversation",
+        {
+            "composerData:test123": {"padding": _PAD100},
+            "bubbleId:test123:bubble1": {
+                "bubbleId": "bubble1",
+                "type": 1,
+                "text": "Hello " + _PAD100,
+            },
+        },
+        [False],
+    ),
+    (
+        "json_decode_error",
+        {"bubbleId:test123:bubble1": _BAD_JSON},
+        [],
+    ),
+    (
+        "base64_signature",
+        {
+            "composerData:test123": {
+                "fullConversationHeadersOnly": [{"bubbleId": "bubble1"}],
+                "padding": _PAD100,
+            },
+            "bubbleId:test123:bubble1": {
+                "bubbleId": "bubble1",
+                "type": 2,
+                "text": "",
+                "isThought": True,
+                "thinking": {"signature": "AVSoXOInvalidBase64Data" + _PAD100},
+            },
+        },
+        [True],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "rows,thought_flags",
+    [case[1:] for case in _BUBBLE_SCENARIOS],
+    ids=[case[0] for case in _BUBBLE_SCENARIOS],
+)
+def test_get_dialog_messages_scenarios(dialog_messages, rows, thought_flags):
+    messages = dialog_messages(rows)
+    assert [m["is_thought"] for m in messages] == thought_flags
 
 
 if __name__ == "__main__":
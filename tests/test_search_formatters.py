@@ -2,13 +2,16 @@
 Tests for search_history formatting functions.
 """
 
+import io
 import json
 import os
 import sqlite3
 import sys
 import tempfile
 import unittest
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -26,6 +29,24 @@ class TestHighlightQuery(unittest.TestCase):
         self.assertIn("\033[0m", highlighted)
         self.assertIn("KiloCode", highlighted)
 
+    def test_highlight_query_multiple_preserves_case(self):
+        """Test every occurrence is wrapped and keeps its original casing."""
+        highlighted = search_history.highlight_query("kilo KILO Kilo", "Kilo")
+        self.assertEqual(
+            highlighted,
+            "\033[1;33mkilo\033[0m \033[1;33mKILO\033[0m \033[1;33mKilo\033[0m",
+        )
+
+    def test_highlight_query_no_match_and_empty_query(self):
+        """Test text is returned unchanged without a match or query."""
+        self.assertEqual(search_history.highlight_query("abc", "xyz"), "abc")
+        self.assertEqual(search_history.highlight_query("abc", ""), "abc")
+
+    def test_highlight_query_length_changing_lowercase(self):
+        """Test fallback when lowercasing changes the text length."""
+        highlighted = search_history.highlight_query("İx foo", "foo")
+        self.assertEqual(highlighted, "İx \033[1;33mfoo\033[0m")
+
 
 class TestFormatSearchResults(unittest.TestCase):
     """Test format_search_results function."""
@@ -58,6 +79,9 @@ class TestFormatSearchResults(unittest.TestCase):
         self.assertIn("MyProject", output)
         self.assertIn("KiloCode Discussion", output)
         self.assertIn("1 match", output)
+        expected_date = datetime.fromtimestamp(1704067200).strftime("%Y-%m-%d %H:%M")
+        self.assertIn(f"📅 Last updated: {expected_date}", output)
+        self.assertIn(f"📅 Created: {expected_date}", output)
 
     def test_format_search_results_with_context(self):
         """Test formatting with context enabled."""
@@ -132,6 +156,49 @@ class TestFormatSearchResults(unittest.TestCase):
         ]
         output = search_history.format_search_results(results, "KiloCode", searcher)
         self.assertIn("...", output)
+        self.assertIn("x" * 200 + "\033[1;33mKiloCode\033[0m" + "y" * 200, output)
+        self.assertNotIn("x" * 201, output)
+
+    def test_format_search_results_excerpt_after_length_changing_lowercase(self):
+        """Test the excerpt highlights the query when lowercasing adds chars."""
+        searcher = search_history.CursorHistorySearch()
+        results = [
+            {
+                "field": "text",
+                "content": "İ" * 50 + "a" * 300 + "KiloCode" + "b" * 300,
+                "type": 1,
+                "bubble_id": "bubble1",
+                "composer_id": "comp1",
+                "project_name": "Project",
+                "folder_path": "/path",
+                "dialog_name": "Dialog",
+                "last_updated": 0,
+                "created_at": 0,
+            }
+        ]
+        output = search_history.format_search_results(results, "kilocode", searcher)
+        self.assertIn("\033[1;33mKiloCode\033[0m", output)
+        self.assertNotIn("\033[1;33mbbbbbbbb\033[0m", output)
+
+    def test_format_search_results_long_content_without_match(self):
+        """Test long content is cut at 500 chars when the query is absent."""
+        searcher = search_history.CursorHistorySearch()
+        results = [
+            {
+                "field": "thinking",
+                "content": "z" * 700,
+                "bubble_id": "bubble1",
+                "composer_id": "comp1",
+                "project_name": "Project",
+                "folder_path": "/path",
+                "dialog_name": "Dialog",
+                "last_updated": 0,
+                "created_at": 0,
+            }
+        ]
+        output = search_history.format_search_results(results, "KiloCode", searcher)
+        self.assertIn("   " + "z" * 500 + "...", output)
+        self.assertNotIn("z" * 501, output)
 
     def test_format_search_results_tool_type(self):
         """Test formatting tool result type."""
@@ -194,6 +261,42 @@ class TestFormatSearchResults(unittest.TestCase):
         self.assertIn("🤖 AI", output)
 
 
+class TestStreamFormatters(unittest.TestCase):
+    """Test streaming variants of the formatters."""
+
+    def test_stream_search_results_matches_format(self):
+        """Test streamed output equals the formatted string plus newline."""
+        searcher = search_history.CursorHistorySearch()
+        results = [
+            {
+                "field": "text",
+                "content": "Discussing KiloCode features",
+                "type": 1,
+                "bubble_id": "bubble1",
+                "composer_id": "comp1",
+                "project_name": "MyProject",
+                "folder_path": "/home/user/MyProject",
+                "dialog_name": "KiloCode Discussion",
+                "last_updated": 1704067200000,
+                "created_at": 0,
+            }
+        ]
+        for items in (results, []):
+            out = io.StringIO()
+            search_history.stream_search_results(items, "kilocode", searcher, out=out)
+            expected = search_history.format_search_results(items, "kilocode", searcher)
+            self.assertEqual(out.getvalue(), expected + "\n")
+
+    def test_stream_full_dialog_defaults_to_stdout(self):
+        """Test streaming a dialog writes to sys.stdout when no stream given."""
+        messages = [{"type": 1, "text": "Hello AI", "tool_data": None}]
+        captured = io.StringIO()
+        with patch("sys.stdout", captured):
+            search_history.stream_full_dialog(messages, "Dialog", "Project")
+        expected = search_history.format_full_dialog(messages, "Dialog", "Project")
+        self.assertEqual(captured.getvalue(), expected + "\n")
+
+
 class TestFormatFullDialog(unittest.TestCase):
     """Test format_full_dialog function."""
 
@@ -0,0 +1,196 @@
+"""
+Tests for search_history prefilter module (raw-value prefilters and caches).
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import search_history
+from search_history import prefilter
+from search_history.prefilter import get_ordered_bubble_ids, load_ordered_bubble_ids
+
+
+class TestValuePrefilter(unittest.TestCase):
+    """Test the raw-bytes prefilter used by search_all."""
+
+    def test_search_all_fast_byte_prefilter(self):
+        """Test the raw-bytes prefilter across case modes and short values."""
+        searcher = search_history.CursorHistorySearch()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            global_db = Path(tmpdir) / "global.vscdb"
+            conn = sqlite3.connect(global_db)
+            conn.execute("CREATE TABLE ItemTable (key TEXT, value TEXT)")
+            conn.execute(
+                "INSERT INTO ItemTable VALUES (?, ?)",
+                (
+                    "composer.composerHeaders",
+                    json.dumps({"allComposers": [{"composerId": "comp1"}]}),
+                ),
+            )
+            conn.execute("CREATE TABLE cursorDiskKV (key TEXT, value TEXT)")
+            bubbles = {
+                "short": {"text": "Привет"},
+                "long": {"text": "Привет KiloCode " + "x" * 100},
+            }
+            for bid, bubble in bubbles.items():
+                conn.execute(
+                    "INSERT INTO cursorDiskKV VALUES (?, ?)",
+                    (
+                        f"bubbleId:comp1:{bid}",
+                        json.dumps(dict(bubble, bubbleId=bid), ensure_ascii=False),
+                    ),
+                )
+            conn.commit()
+            conn.close()
+
+            searcher.workspace_storage_path = Path(tmpdir) / "missing"
+            searcher.global_storage_path = global_db
+
+            results = searcher.search_all("привет")
+            self.assertEqual([r["bubble_id"] for r in results], ["long"])
+            self.assertEqual(len(searcher.search_all("kilocode")), 1)
+            self.assertEqual(searcher.search_all("kilocode", case_sensitive=True), [])
+            self.assertEqual(len(searcher.search_all("KiloCode", True)), 1)
+
+    def test_value_prefilter_without_hyperscan(self):
+        """Test the regex prefilter used when Hyperscan is not installed."""
+        with patch.object(prefilter, "hyperscan", None):
+            matches = prefilter.build_value_prefilter("Kilo.Code", False)
+        self.assertTrue(matches(b'{"text": "about KILO.CODE"}'))
+        self.assertFalse(matches(b'{"text": "about KILOxCODE"}'))
+
+    @unittest.skipUnless(prefilter.hyperscan, "hyperscan not installed")
+    def test_value_prefilter_with_hyperscan(self):
+        """Test the Hyperscan prefilter matches literally and case-insensitively."""
+        matches = prefilter.build_value_prefilter("Kilo.Code", False)
+        self.assertTrue(matches(b'{"text": "about KILO.CODE"}'))
+        self.assertFalse(matches(b'{"text": "about KILOxCODE"}'))
+        self.assertTrue(matches(b"kilo.code kilo.code"))
+
+
+class TestOrderedBubbleIds(unittest.TestCase):
+    """Test the cached composerData bubble order lookup."""
+
+    def test_ordered_bubble_ids_cached_until_db_changes(self):
+        """Test repeat lookups hit the cache and a DB write invalidates them."""
+        composer_data = {
+            "fullConversationHeadersOnly": [
+                {"bubbleId": "bubble1"},
+                {"bubbleId": "bubble2"},
+            ],
+            "padding": "x" * 100,
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "global.vscdb"
+            conn = sqlite3.connect(db_path)
+            conn.execute("CREATE TABLE cursorDiskKV (key TEXT, value TEXT)")
+            conn.execute(
+                "INSERT INTO cursorDiskKV VALUES (?, ?)",
+                ("composerData:comp1", json.dumps(composer_data)),
+            )
+            conn.commit()
+            conn.close()
+
+            ids = get_ordered_bubble_ids(db_path, "comp1")
+            self.assertEqual(ids, ("bubble1", "bubble2"))
+
+            hits = load_ordered_bubble_ids.cache_info().hits
+            self.assertEqual(get_ordered_bubble_ids(db_path, "comp1"), ids)
+            self.assertEqual(load_ordered_bubble_ids.cache_info().hits, hits + 1)
+
+            composer_data["fullConversationHeadersOnly"].reverse()
+            conn = sqlite3.connect(db_path)
+            conn.execute(
+                "UPDATE cursorDiskKV SET value = ? WHERE key = 'composerData:comp1'",
+                (json.dumps(composer_data),),
+            )
+            conn.commit()
+            conn.close()
+            stat = db_path.stat()
+            os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            self.assertEqual(
+                get_ordered_bubble_ids(db_path, "comp1"), ("bubble2", "bubble1")
+            )
+
+
+class TestWorkspaceComposersCache(unittest.TestCase):
+    """Test the per-workspace composer cache behind get_all_composers."""
+
+    def test_get_all_composers_cached_until_mtime_changes(self):
+        """Test workspace composers are reused until state.vscdb or its WAL change."""
+        searcher = search_history.CursorHistorySearch()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace_dir = Path(tmpdir) / "workspace1"
+            workspace_dir.mkdir()
+            (workspace_dir / "workspace.json").write_text(
+                json.dumps({"folder": "file:///home/user/project"})
+            )
+
+            state_db = workspace_dir / "state.vscdb"
+            conn = sqlite3.connect(state_db)
+            conn.execute("CREATE TABLE ItemTable (key TEXT, value TEXT)")
+            conn.execute(
+                "INSERT INTO ItemTable VALUES (?, ?)",
+                (
+                    "composer.composerData",
+                    json.dumps({"allComposers": [{"composerId": "comp1"}]}),
+                ),
+            )
+            conn.commit()
+            conn.close()
+
+            searcher.workspace_storage_path = Path(tmpdir)
+            searcher.global_storage_path = Path(tmpdir) / "nonexistent.vscdb"
+            first = searcher.get_all_composers()
+            self.assertEqual([c["composerId"] for c in first], ["comp1"])
+            cached_composers = searcher._composers_cache["workspace1"][3]
+            self.assertNotIn("_project_name", cached_composers[0])
+
+            stat = state_db.stat()
+            conn = sqlite3.connect(state_db)
+            conn.execute(
+                "UPDATE ItemTable SET value = ?",
+                (json.dumps({"allComposers": [{"composerId": "comp2"}]}),),
+            )
+            conn.commit()
+            conn.close()
+
+            os.utime(state_db, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            cached = searcher.get_all_composers()
+            self.assertEqual([c["composerId"] for c in cached], ["comp1"])
+
+            os.utime(state_db, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            refreshed = searcher.get_all_composers()
+            self.assertEqual([c["composerId"] for c in refreshed], ["comp2"])
+
+            # Uncheckpointed WAL writes leave state.vscdb itself untouched
+            stat = state_db.stat()
+            conn = sqlite3.connect(state_db)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "UPDATE ItemTable SET value = ?",
+                (json.dumps({"allComposers": [{"composerId": "comp3"}]}),),
+            )
+            conn.commit()
+            os.utime(state_db, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            try:
+                from_wal = searcher.get_all_composers()
+            finally:
+                conn.close()
+            self.assertEqual([c["composerId"] for c in from_wal], ["comp3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
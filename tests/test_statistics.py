@@ -2,24 +2,86 @@
 Tests for statistics.py module - statistics collection and formatting.
 """
 
+import re
 import sys
 import unittest
 from collections import Counter
 from datetime import datetime, timedelta
-from io import StringIO
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import cursor_chronicle
 
-
+# Minimal non-empty stats skeleton; tests override only the fields they exercise
+_BASE_STATS = {
+    "period_start": None,
+    "period_end": None,
+    "total_dialogs": 5,
+    "total_messages": 100,
+    "user_messages": 30,
+    "ai_messages": 70,
+    "tool_calls": 50,
+    "thinking_bubbles": 0,
+    "total_tokens_in": 0,
+    "total_tokens_out": 0,
+    "total_thinking_time_ms": 0,
+    "projects": {},
+    "tool_usage": Counter(),
+    "daily_activity": {},
+    "dialogs_by_length": [],
+}
+
+_PERIOD_START = datetime(2024, 1, 1)
+_PERIOD_END = datetime(2024, 1, 31)
+
+_MAY_DAILY_ACTIVITY = {
+    f"2025-05-{i:02d}": {"dialogs": 1, "messages": 5} for i in range(1, 28)
+}
+
+_JAN_DAILY_ACTIVITY = {
+    f"2024-01-{i:02d}": {"dialogs": 1, "messages": 5} for i in range(1, 25)
+}
+
+_MANY_PROJECTS = {
+    f"project{i}": {
+        "dialogs": i,
+        "messages": i * 10,
+        "user_messages": i * 3,
+        "ai_messages": i * 7,
+        "tool_calls": i,
+        "tokens_in": i * 100,
+        "tokens_out": i * 50,
+        "dialog_names": [],
+    }
+    for i in range(1, 20)
+}
+
+# Sections format_statistics must emit, in order, for a populated stats dict
+_STATS_SECTIONS = re.compile(
+    r"USAGE STATISTICS.*SUMMARY.*Total dialogs:\s+5\b.*PROJECT ACTIVITY.*test-project",
+    re.DOTALL,
+)
+
+
+def _stats(**overrides):
+    """Return a stats dict built from _BASE_STATS with overrides applied."""
+    return {**_BASE_STATS, **overrides}
+
+
+@pytest.mark.integration
 class TestStatisticsFeature(unittest.TestCase):
     """Test the statistics functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.viewer = cursor_chronicle.CursorChatViewer()
+
     def test_get_dialog_statistics_returns_dict(self):
         """Test that get_dialog_statistics returns a dictionary."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         end_date = datetime.now()
         start_date = end_date - timedelta(days=1)
         result = cursor_chronicle.get_dialog_statistics(
@@ -29,7 +91,7 @@ class TestStatisticsFeature(unittest.TestCase):
 
     def test_get_dialog_statistics_has_required_keys(self):
         """Test that statistics dict has required keys."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         end_date = datetime.now()
         start_date = end_date - timedelta(days=1)
         result = cursor_chronicle.get_dialog_statistics(
@@ -42,7 +104,7 @@ class TestStatisticsFeature(unittest.TestCase):
 
     def test_get_dialog_statistics_with_date_filter(self):
         """Test statistics with date filtering."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         end_date = datetime.now()
         start_date = end_date - timedelta(days=7)
 
@@ -56,7 +118,7 @@ class TestStatisticsFeature(unittest.TestCase):
 
     def test_get_dialog_statistics_with_project_filter(self):
         """Test statistics with project filtering."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         end_date = datetime.now()
         start_date = end_date - timedelta(days=7)
 
@@ -76,7 +138,7 @@ class TestStatisticsFeature(unittest.TestCase):
 
     def test_statistics_counts_are_non_negative(self):
         """Test that all counts in statistics are non-negative."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         end_date = datetime.now()
         start_date = end_date - timedelta(days=1)
         result = cursor_chronicle.get_dialog_statistics(
@@ -93,7 +155,7 @@ class TestStatisticsFeature(unittest.TestCase):
 
     def test_daily_activity_in_stats(self):
         """Test that daily_activity is properly populated."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         end_date = datetime.now()
         start_date = end_date - timedelta(days=7)
 
@@ -121,19 +183,14 @@ class TestFormatStatistics(unittest.TestCase):
 
     def test_format_statistics_with_data(self):
         """Test format_statistics with sample data."""
-        sample_stats = {
-            "period_start": datetime(2024, 1, 1),
-            "period_end": datetime(2024, 1, 31),
-            "total_dialogs": 5,
-            "total_messages": 100,
-            "user_messages": 30,
-            "ai_messages": 70,
-            "tool_calls": 50,
-            "thinking_bubbles": 10,
-            "total_tokens_in": 10000,
-            "total_tokens_out": 5000,
-            "total_thinking_time_ms": 30000,
-            "projects": {
+        sample_stats = _stats(
+            period_start=_PERIOD_START,
+            period_end=_PERIOD_END,
+            thinking_bubbles=10,
+            total_tokens_in=10000,
+            total_tokens_out=5000,
+            total_thinking_time_ms=30000,
+            projects={
                 "test-project": {
                     "dialogs": 5,
                     "messages": 100,
@@ -145,43 +202,26 @@ class TestFormatStatistics(unittest.TestCase):
                     "dialog_names": ["Dialog 1", "Dialog 2"],
                 }
             },
-            "tool_usage": Counter({"read_file": 20, "edit_file": 30}),
-            "daily_activity": {"2024-01-15": {"dialogs": 2, "messages": 40}},
-            "dialogs_by_length": [("Dialog 1", "test-project", 60)],
-        }
+            tool_usage=Counter({"read_file": 20, "edit_file": 30}),
+            daily_activity={"2024-01-15": {"dialogs": 2, "messages": 40}},
+            dialogs_by_length=[("Dialog 1", "test-project", 60)],
+        )
 
         result = cursor_chronicle.format_statistics(sample_stats)
 
-        self.assertIn("USAGE STATISTICS", result)
-        self.assertIn("SUMMARY", result)
-        self.assertIn("Total dialogs:", result)
-        self.assertIn("5", result)
-        self.assertIn("PROJECT ACTIVITY", result)
-        self.assertIn("test-project", result)
+        self.assertRegex(result, _STATS_SECTIONS)
 
     def test_format_statistics_shows_coding_days(self):
         """Test that format_statistics shows coding days percentage."""
-        sample_stats = {
-            "period_start": datetime(2024, 1, 1),
-            "period_end": datetime(2024, 1, 11),
-            "total_dialogs": 5,
-            "total_messages": 100,
-            "user_messages": 30,
-            "ai_messages": 70,
-            "tool_calls": 50,
-            "thinking_bubbles": 0,
-            "total_tokens_in": 0,
-            "total_tokens_out": 0,
-            "total_thinking_time_ms": 0,
-            "projects": {},
-            "tool_usage": Counter(),
-            "daily_activity": {
+        sample_stats = _stats(
+            period_start=_PERIOD_START,
+            period_end=datetime(2024, 1, 11),
+            daily_activity={
                 "2024-01-02": {"dialogs": 2, "messages": 40},
                 "2024-01-05": {"dialogs": 1, "messages": 30},
                 "2024-01-08": {"dialogs": 2, "messages": 30},
             },
-            "dialogs_by_length": [],
-        }
+        )
 
         result = cursor_chronicle.format_statistics(sample_stats)
 
@@ -191,26 +231,12 @@ class TestFormatStatistics(unittest.TestCase):
 
     def test_format_statistics_coding_days_without_dates(self):
         """Test coding days display when no period dates."""
-        sample_stats = {
-            "period_start": None,
-            "period_end": None,
-            "total_dialogs": 5,
-            "total_messages": 100,
-            "user_messages": 30,
-            "ai_messages": 70,
-            "tool_calls": 50,
-            "thinking_bubbles": 0,
-            "total_tokens_in": 0,
-            "total_tokens_out": 0,
-            "total_thinking_time_ms": 0,
-            "projects": {},
-            "tool_usage": Counter(),
-            "daily_activity": {
+        sample_stats = _stats(
+            daily_activity={
                 "2024-01-02": {"dialogs": 2, "messages": 40},
                 "2024-01-05": {"dialogs": 1, "messages": 30},
             },
-            "dialogs_by_length": [],
-        }
+        )
 
         result = cursor_chronicle.format_statistics(sample_stats)
 
@@ -219,25 +245,12 @@ class TestFormatStatistics(unittest.TestCase):
 
     def test_coding_days_month_calculation(self):
         """Test that coding days correctly calculates month boundaries."""
-        sample_stats = {
-            "period_start": datetime(2025, 5, 1),
-            "period_end": datetime(2025, 6, 1),
-            "total_dialogs": 10,
-            "total_messages": 100,
-            "user_messages": 30,
-            "ai_messages": 70,
-            "tool_calls": 50,
-            "thinking_bubbles": 0,
-            "total_tokens_in": 0,
-            "total_tokens_out": 0,
-            "total_thinking_time_ms": 0,
-            "projects": {},
-            "tool_usage": Counter(),
-            "daily_activity": {
-                f"2025-05-{i:02d}": {"dialogs": 1, "messages": 5} for i in range(1, 28)
-            },
-            "dialogs_by_length": [],
-        }
+        sample_stats = _stats(
+            period_start=datetime(2025, 5, 1),
+            period_end=datetime(2025, 6, 1),
+            total_dialogs=10,
+            daily_activity=_MAY_DAILY_ACTIVITY,
+        )
 
         result = cursor_chronicle.format_statistics(sample_stats)
 
@@ -246,23 +259,11 @@ class TestFormatStatistics(unittest.TestCase):
 
     def test_format_statistics_no_tokens(self):
         """Test formatting stats without tokens."""
-        stats = {
-            "period_start": datetime(2024, 1, 1),
-            "period_end": datetime(2024, 1, 31),
-            "total_dialogs": 5,
-            "total_messages": 100,
-            "user_messages": 30,
-            "ai_messages": 70,
-            "tool_calls": 0,
-            "thinking_bubbles": 0,
-            "total_tokens_in": 0,
-            "total_tokens_out": 0,
-            "total_thinking_time_ms": 0,
-            "projects": {},
-            "tool_usage": Counter(),
-            "daily_activity": {},
-            "dialogs_by_length": [],
-        }
+        stats = _stats(
+            period_start=_PERIOD_START,
+            period_end=_PERIOD_END,
+            tool_calls=0,
+        )
 
         result = cursor_chronicle.format_statistics(stats)
         self.assertIn("Total dialogs:", result)
@@ -270,27 +271,13 @@ class TestFormatStatistics(unittest.TestCase):
 
     def test_format_statistics_max_days_limit(self):
         """Test daily activity is limited by max_days."""
-        daily_activity = {
-            f"2024-01-{i:02d}": {"dialogs": 1, "messages": 5} for i in range(1, 25)
-        }
-
-        stats = {
-            "period_start": datetime(2024, 1, 1),
-            "period_end": datetime(2024, 1, 31),
-            "total_dialogs": 20,
-            "total_messages": 100,
-            "user_messages": 30,
-            "ai_messages": 70,
-            "tool_calls": 0,
-            "thinking_bubbles": 0,
-            "total_tokens_in": 0,
-            "total_tokens_out": 0,
-            "total_thinking_time_ms": 0,
-            "projects": {},
-            "tool_usage": Counter(),
-            "daily_activity": daily_activity,
-            "dialogs_by_length": [],
-        }
+        stats = _stats(
+            period_start=_PERIOD_START,
+            period_end=_PERIOD_END,
+            total_dialogs=20,
+            tool_calls=0,
+            daily_activity=_JAN_DAILY_ACTIVITY,
+        )
 
         result = cursor_chronicle.format_statistics(stats, max_days=5)
         self.assertIn("DAILY ACTIVITY", result)
@@ -298,63 +285,32 @@ class TestFormatStatistics(unittest.TestCase):
 
     def test_format_statistics_many_projects(self):
         """Test project activity truncation."""
-        projects = {
-            f"project{i}": {
-                "dialogs": i,
-                "messages": i * 10,
-                "user_messages": i * 3,
-                "ai_messages": i * 7,
-                "tool_calls": i,
-                "tokens_in": i * 100,
-                "tokens_out": i * 50,
-                "dialog_names": [],
-            }
-            for i in range(1, 20)
-        }
-
-        stats = {
-            "period_start": datetime(2024, 1, 1),
-            "period_end": datetime(2024, 1, 31),
-            "total_dialogs": 100,
-            "total_messages": 1000,
-            "user_messages": 300,
-            "ai_messages": 700,
-            "tool_calls": 50,
-            "thinking_bubbles": 0,
-            "total_tokens_in": 10000,
-            "total_tokens_out": 5000,
-            "total_thinking_time_ms": 0,
-            "projects": projects,
-            "tool_usage": Counter(),
-            "daily_activity": {},
-            "dialogs_by_length": [],
-        }
+        stats = _stats(
+            period_start=_PERIOD_START,
+            period_end=_PERIOD_END,
+            total_dialogs=100,
+            total_messages=1000,
+            user_messages=300,
+            ai_messages=700,
+            total_tokens_in=10000,
+            total_tokens_out=5000,
+            projects=_MANY_PROJECTS,
+        )
 
         result = cursor_chronicle.format_statistics(stats, top_n=5)
         self.assertIn("PROJECT ACTIVITY", result)
         self.assertIn("more projects", result)
 
 
-class TestShowStatistics(unittest.TestCase):
-    """Test show_statistics function output."""
-
-    def test_show_statistics_output(self):
-        """Test show_statistics produces output."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=1)
-
-        captured = StringIO()
-        sys.stdout = captured
-        try:
-            cursor_chronicle.show_statistics(
-                viewer, days=1, start_date=start_date, end_date=end_date
-            )
-        finally:
-            sys.stdout = sys.__stdout__
-
-        output = captured.getvalue()
-        self.assertIn("Collecting statistics", output)
+def test_show_statistics_output(hermetic_viewer, capsys):
+    end_date = datetime.now()
+    cursor_chronicle.show_statistics(
+        hermetic_viewer,
+        days=1,
+        start_date=end_date - timedelta(days=1),
+        end_date=end_date,
+    )
+    assert "Collecting statistics" in capsys.readouterr().out
 
 
 if __name__ == "__main__":
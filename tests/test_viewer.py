@@ -9,15 +9,26 @@ import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import cursor_chronicle
+from cursor_chronicle.dialog_cache import DialogCache
+from cursor_chronicle.utils import (
+    connect_state_db,
+    parse_workspace_storage_meta,
+    select_composers,
+)
 
 
 class TestCursorChronicle(unittest.TestCase):
     """Test basic functionality of cursor_chronicle."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.viewer = cursor_chronicle.CursorChatViewer()
+
     def test_import(self):
         """Test that cursor_chronicle can be imported."""
         self.assertIsNotNone(cursor_chronicle)
@@ -29,7 +40,7 @@ class TestCursorChronicle(unittest.TestCase):
 
     def test_tool_types_mapping(self):
         """Test that tool types mapping is properly defined."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         self.assertIsInstance(viewer.tool_types, dict)
         self.assertGreater(len(viewer.tool_types), 0)
         self.assertIn(1, viewer.tool_types)
@@ -37,49 +48,135 @@ class TestCursorChronicle(unittest.TestCase):
 
     def test_config_paths(self):
         """Test that config paths are properly set."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         self.assertIsInstance(viewer.cursor_config_path, Path)
         self.assertIsInstance(viewer.workspace_storage_path, Path)
         self.assertIsInstance(viewer.global_storage_path, Path)
-        p = str(viewer.cursor_config_path)
+        cp, ws, gs = map(
+            str,
+            (
+                viewer.cursor_config_path,
+                viewer.workspace_storage_path,
+                viewer.global_storage_path,
+            ),
+        )
         if sys.platform == "darwin":
-            self.assertTrue(p.endswith("Application Support/Cursor/User"))
+            self.assertTrue(cp.endswith("Application Support/Cursor/User"))
         elif sys.platform == "win32":
-            norm = p.replace("\\", "/")
+            norm = cp.replace("\\", "/")
             self.assertTrue(norm.endswith("Cursor/User"))
         else:
-            self.assertTrue(p.endswith(".config/Cursor/User"))
-        self.assertTrue(str(viewer.workspace_storage_path).endswith("workspaceStorage"))
-        self.assertTrue(str(viewer.global_storage_path).endswith("state.vscdb"))
+            self.assertTrue(cp.endswith(".config/Cursor/User"))
+        self.assertTrue(ws.endswith("workspaceStorage"))
+        self.assertTrue(gs.endswith("state.vscdb"))
+
+
+def _ms(*args) -> int:
+    """Millisecond timestamp for a local datetime, as Cursor stores it."""
+    return int(datetime(*args).timestamp() * 1000)
+
+
+def _fixture_composer(cid, name, project, created, updated) -> dict:
+    """Build a composerHeaders entry for a project under /home/user."""
+    return {
+        "composerId": cid,
+        "name": name,
+        "createdAt": created,
+        "lastUpdatedAt": updated,
+        "workspaceIdentifier": {
+            "id": project,
+            "uri": {"fsPath": f"/home/user/{project}", "scheme": "file"},
+        },
+    }
+
+
+# Synthetic dialogs spanning several years and projects; the created_at and
+# last_updated orders differ so each sort mode is actually exercised.
+_FIXTURE_COMPOSERS = [
+    _fixture_composer(
+        "a1", "Fix auth bug", "alpha-app", _ms(2023, 6, 1), _ms(2023, 6, 2)
+    ),
+    _fixture_composer("a2", "add tests", "alpha-app", _ms(2024, 3, 1), _ms(2025, 5, 1)),
+    _fixture_composer(
+        "b1", "Refactor parser", "beta-service", _ms(2024, 8, 10), _ms(2024, 8, 11)
+    ),
+    _fixture_composer(
+        "b2", "Deploy script", "beta-service", _ms(2025, 1, 15), _ms(2025, 2, 1)
+    ),
+    _fixture_composer("c1", "benchmark", "gamma", _ms(2026, 2, 20), _ms(2026, 2, 21)),
+]
+
+EXPECTED_DIALOG_KEYS = frozenset(
+    {
+        "composer_id",
+        "name",
+        "project_name",
+        "folder_path",
+        "last_updated",
+        "created_at",
+    }
+)
+
+# (get_all_dialogs kwargs, dialog key the result is ordered by, descending)
+_SORT_CASES = [
+    ({}, "created_at", False),
+    ({"sort_desc": True}, "created_at", True),
+    ({"use_updated": True}, "last_updated", False),
+    ({"use_updated": True, "sort_desc": True}, "last_updated", True),
+    ({"sort_by": "name"}, "name", False),
+    ({"sort_by": "project"}, "project_name", False),
+]
 
 
 class TestListAllDialogs(unittest.TestCase):
     """Test list_all_dialogs and get_all_dialogs functionality."""
 
-    def test_get_all_dialogs_method_exists(self):
-        """Test that get_all_dialogs method exists."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        self.assertTrue(hasattr(viewer, "get_all_dialogs"))
-        self.assertTrue(callable(viewer.get_all_dialogs))
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        tmp_path = Path(cls._tmp.name)
+        db_path = tmp_path / "state.vscdb"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE ItemTable (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute(
+            "INSERT INTO ItemTable VALUES (?, ?)",
+            (
+                "composer.composerHeaders",
+                json.dumps({"allComposers": _FIXTURE_COMPOSERS}),
+            ),
+        )
+        conn.commit()
+        conn.close()
 
-    def test_list_all_dialogs_method_exists(self):
-        """Test that list_all_dialogs method exists."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        self.assertTrue(hasattr(viewer, "list_all_dialogs"))
-        self.assertTrue(callable(viewer.list_all_dialogs))
+        cls.viewer = cursor_chronicle.CursorChatViewer()
+        cls.viewer.global_storage_path = db_path
+        cls.viewer.workspace_storage_path = tmp_path / "nonexistent"
+        # Unfiltered default-sorted scan shared by tests that need no arguments
+        cls.baseline = cls.viewer.get_all_dialogs()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_dialog_methods_exist(self):
+        """Test that the dialog listing methods exist and are callable."""
+        for name in ("get_all_dialogs", "list_all_dialogs", "get_dialog_messages"):
+            with self.subTest(name=name):
+                self.assertTrue(callable(getattr(self.viewer, name, None)))
 
     def test_get_all_dialogs_returns_list(self):
         """Test that get_all_dialogs returns a list."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        result = viewer.get_all_dialogs()
+        result = self.baseline
         self.assertIsInstance(result, list)
+        self.assertEqual(len(result), len(_FIXTURE_COMPOSERS))
 
     def test_get_all_dialogs_with_date_filtering(self):
         """Test date filtering parameters."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         start = datetime(2024, 1, 1)
         result = viewer.get_all_dialogs(start_date=start)
         self.assertIsInstance(result, list)
+        self.assertEqual(len(result), len(self.baseline) - 1)
         for dialog in result:
             if dialog.get("last_updated"):
                 dialog_date = datetime.fromtimestamp(dialog["last_updated"] / 1000)
@@ -87,10 +184,11 @@ class TestListAllDialogs(unittest.TestCase):
 
     def test_get_all_dialogs_with_end_date(self):
         """Test end date filtering."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        end = datetime(2030, 12, 31)
+        viewer = self.viewer
+        end = datetime(2025, 12, 31)
         result = viewer.get_all_dialogs(end_date=end)
         self.assertIsInstance(result, list)
+        self.assertEqual(len(result), len(self.baseline) - 1)
         for dialog in result:
             if dialog.get("last_updated"):
                 dialog_date = datetime.fromtimestamp(dialog["last_updated"] / 1000)
@@ -98,209 +196,156 @@ class TestListAllDialogs(unittest.TestCase):
 
     def test_get_all_dialogs_with_project_filter(self):
         """Test project name filtering."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        all_dialogs = viewer.get_all_dialogs()
-        if all_dialogs:
-            project_name = all_dialogs[0].get("project_name", "")
-            if project_name:
-                filtered = viewer.get_all_dialogs(project_filter=project_name)
-                for dialog in filtered:
-                    self.assertIn(project_name.lower(), dialog["project_name"].lower())
+        project_name = self.baseline[0]["project_name"]
+        filtered = self.viewer.get_all_dialogs(project_filter=project_name)
+        self.assertEqual(len(filtered), 2)
+        for dialog in filtered:
+            self.assertIn(project_name.lower(), dialog["project_name"].lower())
 
     def test_get_all_dialogs_date_range(self):
         """Test date range filtering."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         start = datetime(2024, 1, 1)
-        end = datetime(2030, 12, 31)
+        end = datetime(2025, 12, 31)
         result = viewer.get_all_dialogs(start_date=start, end_date=end)
         self.assertIsInstance(result, list)
+        self.assertEqual(len(result), len(self.baseline) - 2)
         for dialog in result:
             if dialog.get("last_updated"):
                 dialog_date = datetime.fromtimestamp(dialog["last_updated"] / 1000)
                 self.assertGreaterEqual(dialog_date, start)
                 self.assertLessEqual(dialog_date, end)
 
-    def test_get_all_dialogs_sorted_by_created_asc(self):
-        """Test ascending sort by created_at (default)."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        dialogs = viewer.get_all_dialogs()
-        if len(dialogs) > 1:
-            for i in range(len(dialogs) - 1):
-                current = dialogs[i].get("created_at", 0)
-                next_one = dialogs[i + 1].get("created_at", 0)
-                self.assertLessEqual(current, next_one)
-
-    def test_get_all_dialogs_sorted_by_created_desc(self):
-        """Test descending sort by created_at."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        dialogs = viewer.get_all_dialogs(sort_desc=True)
-        if len(dialogs) > 1:
-            for i in range(len(dialogs) - 1):
-                current = dialogs[i].get("created_at", 0)
-                next_one = dialogs[i + 1].get("created_at", 0)
-                self.assertGreaterEqual(current, next_one)
-
-    def test_get_all_dialogs_sorted_by_updated_asc(self):
-        """Test ascending sort by last_updated."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        dialogs = viewer.get_all_dialogs(use_updated=True)
-        if len(dialogs) > 1:
-            for i in range(len(dialogs) - 1):
-                current = dialogs[i].get("last_updated", 0)
-                next_one = dialogs[i + 1].get("last_updated", 0)
-                self.assertLessEqual(current, next_one)
-
-    def test_get_all_dialogs_sorted_by_updated_desc(self):
-        """Test descending sort by last_updated."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        dialogs = viewer.get_all_dialogs(use_updated=True, sort_desc=True)
-        if len(dialogs) > 1:
-            for i in range(len(dialogs) - 1):
-                current = dialogs[i].get("last_updated", 0)
-                next_one = dialogs[i + 1].get("last_updated", 0)
-                self.assertGreaterEqual(current, next_one)
-
-    def test_get_all_dialogs_sorted_by_name(self):
-        """Test sorting by dialog name."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        dialogs = viewer.get_all_dialogs(sort_by="name")
-        if len(dialogs) > 1:
-            for i in range(len(dialogs) - 1):
-                current = dialogs[i].get("name", "").lower()
-                next_one = dialogs[i + 1].get("name", "").lower()
-                self.assertLessEqual(current, next_one)
-
-    def test_get_all_dialogs_sorted_by_project(self):
-        """Test sorting by project name."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        dialogs = viewer.get_all_dialogs(sort_by="project")
-        if len(dialogs) > 1:
-            for i in range(len(dialogs) - 1):
-                current = dialogs[i].get("project_name", "").lower()
-                next_one = dialogs[i + 1].get("project_name", "").lower()
-                self.assertLessEqual(current, next_one)
+    def test_get_all_dialogs_sort_orders(self):
+        """Test every sort mode orders dialogs by its key."""
+        for kwargs, key, desc in _SORT_CASES:
+            with self.subTest(key=key, desc=desc):
+                dialogs = (
+                    self.viewer.get_all_dialogs(**kwargs) if kwargs else self.baseline
+                )
+                self.assertGreater(len(dialogs), 1)
+                values = [d.get(key, 0) for d in dialogs]
+                if key in ("name", "project_name"):
+                    values = [v.lower() for v in values]
+                self.assertEqual(values, sorted(values, reverse=desc))
 
     def test_dialog_dict_structure(self):
         """Test that returned dialog dicts have expected keys."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        dialogs = viewer.get_all_dialogs()
-        expected_keys = [
-            "composer_id",
-            "name",
-            "project_name",
-            "folder_path",
-            "last_updated",
-            "created_at",
-        ]
-        for dialog in dialogs:
-            for key in expected_keys:
-                self.assertIn(key, dialog)
-
-
-class TestListAllDialogsDisplay(unittest.TestCase):
-    """Test list_all_dialogs display output."""
-
-    def test_list_all_dialogs_no_dialogs(self):
-        """Test list_all_dialogs with no dialogs."""
-        import sys as sys_module
-        from io import StringIO
-
-        viewer = cursor_chronicle.CursorChatViewer()
-        start_date = datetime(2099, 1, 1)
-        end_date = datetime(2099, 12, 31)
-
-        captured = StringIO()
-        sys_module.stdout = captured
-        try:
-            viewer.list_all_dialogs(start_date=start_date, end_date=end_date)
-        finally:
-            sys_module.stdout = sys_module.__stdout__
-
-        output = captured.getvalue()
-        self.assertIn("No dialogs found", output)
-
-    def test_list_all_dialogs_no_dialogs_start_only(self):
-        """Test list_all_dialogs with only start date filter."""
-        import sys as sys_module
-        from io import StringIO
+        for dialog in self.baseline:
+            self.assertGreaterEqual(dialog.keys(), EXPECTED_DIALOG_KEYS)
 
+    def test_get_all_dialogs_date_window_applied_in_sql(self):
+        """Test the date window is bound into the SQL query, not filtered later."""
+        start = datetime(2024, 1, 1)
+        statements = []
+        real_connect = sqlite3.connect
+
+        def tracing_connect(*args, **kwargs):
+            conn = real_connect(*args, **kwargs)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        with patch("sqlite3.connect", tracing_connect), patch.object(
+            self.viewer, "_dialog_cache", DialogCache()
+        ):
+            result = self.viewer.get_all_dialogs(start_date=start, use_updated=True)
+
+        start_ts = str(int(start.timestamp() * 1000))
+        windowed = [sql for sql in statements if "json_each" in sql]
+        self.assertEqual(len(windowed), 1)
+        self.assertIn(start_ts, windowed[0])
+        self.assertIn("$.lastUpdatedAt", windowed[0])
+        self.assertEqual(len(result), len(self.baseline) - 1)
+
+    def test_select_composers_returns_ids_outside_window(self):
+        """Test ids of filtered-out composers are still reported for dedup."""
+        with sqlite3.connect(self.viewer.global_storage_path) as conn:
+            composers, ids = select_composers(
+                conn, "composer.composerHeaders", "createdAt", _ms(2026, 1, 1), None
+            )
+        self.assertEqual([c["composerId"] for c in composers], ["c1"])
+        self.assertCountEqual(ids, [c["composerId"] for c in _FIXTURE_COMPOSERS])
+
+    def test_get_all_dialogs_cached_until_storage_changes(self):
+        """Test repeat calls skip SQLite and a write to the DB invalidates them."""
+        db_path = Path(self._tmp.name) / "cache.vscdb"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE ItemTable (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute(
+                "INSERT INTO ItemTable VALUES (?, ?)",
+                (
+                    "composer.composerHeaders",
+                    json.dumps({"allComposers": _FIXTURE_COMPOSERS[:2]}),
+                ),
+            )
+        conn.close()
         viewer = cursor_chronicle.CursorChatViewer()
-        start_date = datetime(2099, 1, 1)
+        viewer.global_storage_path = db_path
+        viewer.workspace_storage_path = self.viewer.workspace_storage_path
+
+        first = viewer.get_all_dialogs()
+        with patch("sqlite3.connect", side_effect=AssertionError("not cached")):
+            second = viewer.get_all_dialogs()
+        self.assertEqual(second, first)
+        second[0]["name"] = "mutated"
+        self.assertNotEqual(viewer.get_all_dialogs()[0]["name"], "mutated")
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "UPDATE ItemTable SET value = ? WHERE key = ?",
+                (
+                    json.dumps({"allComposers": _FIXTURE_COMPOSERS}),
+                    "composer.composerHeaders",
+                ),
+            )
+        conn.close()
+        self.assertEqual(len(viewer.get_all_dialogs()), len(_FIXTURE_COMPOSERS))
 
-        captured = StringIO()
-        sys_module.stdout = captured
-        try:
-            viewer.list_all_dialogs(start_date=start_date)
-        finally:
-            sys_module.stdout = sys_module.__stdout__
+    def test_connect_state_db_is_read_only(self):
+        """Test viewer connections refuse writes to Cursor's database."""
+        with connect_state_db(self.viewer.global_storage_path) as conn:
+            self.assertEqual(conn.execute("PRAGMA query_only").fetchone(), (1,))
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM ItemTable")
 
-        output = captured.getvalue()
-        self.assertIn("No dialogs found", output)
-        self.assertIn("after", output)
 
-    def test_list_all_dialogs_no_dialogs_end_only(self):
-        """Test list_all_dialogs with only end date filter."""
-        import sys as sys_module
-        from io import StringIO
+# --- list_all_dialogs display ---
 
-        viewer = cursor_chronicle.CursorChatViewer()
-        end_date = datetime(1990, 1, 1)
 
-        captured = StringIO()
-        sys_module.stdout = captured
-        try:
-            viewer.list_all_dialogs(end_date=end_date)
-        finally:
-            sys_module.stdout = sys_module.__stdout__
+def test_list_all_dialogs_no_dialogs(hermetic_viewer, capsys):
+    hermetic_viewer.list_all_dialogs(
+        start_date=datetime(2099, 1, 1), end_date=datetime(2099, 12, 31)
+    )
+    assert "No dialogs found" in capsys.readouterr().out
 
-        output = captured.getvalue()
-        self.assertIn("No dialogs found", output)
-        self.assertIn("before", output)
 
+def test_list_all_dialogs_no_dialogs_start_only(hermetic_viewer, capsys):
+    hermetic_viewer.list_all_dialogs(start_date=datetime(2099, 1, 1))
+    output = capsys.readouterr().out
+    assert "No dialogs found" in output
+    assert "after" in output
 
-class TestListAllDialogsWithData(unittest.TestCase):
-    """Test list_all_dialogs with actual data."""
 
-    def test_list_all_dialogs_with_limit(self):
-        """Test list_all_dialogs respects limit."""
-        import sys as sys_module
-        from io import StringIO
+def test_list_all_dialogs_no_dialogs_end_only(hermetic_viewer, capsys):
+    hermetic_viewer.list_all_dialogs(end_date=datetime(1990, 1, 1))
+    output = capsys.readouterr().out
+    assert "No dialogs found" in output
+    assert "before" in output
 
-        viewer = cursor_chronicle.CursorChatViewer()
 
-        captured = StringIO()
-        sys_module.stdout = captured
-        try:
-            viewer.list_all_dialogs(limit=2)
-        finally:
-            sys_module.stdout = sys_module.__stdout__
-
-        output = captured.getvalue()
-        # Should either have "more dialogs" or show limited results
-        if "All dialogs" in output:
-            # Has dialogs, check limit works
-            dialog_count = output.count("💬")
-            self.assertLessEqual(dialog_count, 2)
-
-    def test_list_all_dialogs_with_project_filter(self):
-        """Test list_all_dialogs with project filter."""
-        import sys as sys_module
-        from io import StringIO
+def test_list_all_dialogs_with_limit(hermetic_viewer, capsys):
+    hermetic_viewer.list_all_dialogs(limit=2)
+    output = capsys.readouterr().out
+    assert "All dialogs" in output
+    assert output.count("💬") == 2
+    assert "1 more dialogs" in output
 
-        viewer = cursor_chronicle.CursorChatViewer()
 
-        captured = StringIO()
-        sys_module.stdout = captured
-        try:
-            viewer.list_all_dialogs(project_filter="cursor-chronicle", limit=5)
-        finally:
-            sys_module.stdout = sys_module.__stdout__
-
-        output = captured.getvalue()
-        # Should show filtered results or no dialogs
-        self.assertTrue(
-            "cursor-chronicle" in output.lower() or "No dialogs found" in output
-        )
+def test_list_all_dialogs_with_project_filter(hermetic_viewer, capsys):
+    hermetic_viewer.list_all_dialogs(project_filter="demo", limit=5)
+    output = capsys.readouterr().out
+    assert "demo-project" in output
+    assert output.count("💬") == 3
 
 
 class TestGetProjectsMultiRootMetadata(unittest.TestCase):
@@ -376,8 +421,6 @@ class TestGetProjectsMultiRootMetadata(unittest.TestCase):
             self.assertEqual(projects[0]["folder_path"], str(weird.resolve()))
 
     def test_parse_workspace_storage_meta_prefers_folder_over_workspace(self):
-        from cursor_chronicle.utils import parse_workspace_storage_meta
-
         name, path = parse_workspace_storage_meta(
             {
                 "folder": "file:///home/user/single-repo",
@@ -388,8 +431,6 @@ class TestGetProjectsMultiRootMetadata(unittest.TestCase):
         self.assertEqual(path, "/home/user/single-repo")
 
     def test_parse_workspace_storage_meta_strips_code_workspace_suffix(self):
-        from cursor_chronicle.utils import parse_workspace_storage_meta
-
         name, path = parse_workspace_storage_meta(
             {
                 "workspace": "file:///tmp/my-app.code-workspace",
@@ -399,105 +440,59 @@ class TestGetProjectsMultiRootMetadata(unittest.TestCase):
         self.assertEqual(path, "/tmp/my-app.code-workspace")
 
 
-class TestListProjects(unittest.TestCase):
-    """Test list_projects method."""
+# --- list_projects / list_dialogs ---
 
-    def test_list_projects_output(self):
-        """Test list_projects produces output."""
-        import sys as sys_module
-        from io import StringIO
 
-        viewer = cursor_chronicle.CursorChatViewer()
-
-        captured = StringIO()
-        sys_module.stdout = captured
-        try:
-            viewer.list_projects()
-        finally:
-            sys_module.stdout = sys_module.__stdout__
-
-        output = captured.getvalue()
-        # Should have "Available projects" or "No projects found"
-        self.assertTrue("Available projects" in output or "No projects found" in output)
+def test_list_projects_output(hermetic_viewer, capsys):
+    hermetic_viewer.list_projects()
+    output = capsys.readouterr().out
+    assert "Available projects" in output
+    assert "demo-project" in output
 
 
-class TestListDialogs(unittest.TestCase):
-    """Test list_dialogs method."""
+def test_list_dialogs_project_not_found(hermetic_viewer, capsys):
+    hermetic_viewer.list_dialogs("nonexistent-project-xyz-12345")
+    assert "not found" in capsys.readouterr().out
 
-    def test_list_dialogs_project_not_found(self):
-        """Test list_dialogs with nonexistent project."""
-        import sys as sys_module
-        from io import StringIO
-
-        viewer = cursor_chronicle.CursorChatViewer()
 
-        captured = StringIO()
-        sys_module.stdout = captured
-        try:
-            viewer.list_dialogs("nonexistent-project-xyz-12345")
-        finally:
-            sys_module.stdout = sys_module.__stdout__
-
-        output = captured.getvalue()
-        self.assertIn("not found", output)
-
-    def test_list_dialogs_with_valid_project(self):
-        """Test list_dialogs with a valid project."""
-        import sys as sys_module
-        from io import StringIO
-
-        viewer = cursor_chronicle.CursorChatViewer()
-        projects = viewer.get_projects()
-
-        if projects:
-            project_name = projects[0]["project_name"]
-
-            captured = StringIO()
-            sys_module.stdout = captured
-            try:
-                viewer.list_dialogs(project_name)
-            finally:
-                sys_module.stdout = sys_module.__stdout__
-
-            output = captured.getvalue()
-            # Should show dialogs or "No dialogs found"
-            self.assertTrue(
-                "Dialogs in project" in output or "No dialogs found" in output
-            )
+def test_list_dialogs_with_valid_project(hermetic_viewer, capsys):
+    hermetic_viewer.list_dialogs("demo-project")
+    output = capsys.readouterr().out
+    assert "Dialogs in project 'demo-project'" in output
+    assert "Demo dialog 2" in output
 
 
 class TestViewerMethods(unittest.TestCase):
     """Test various viewer methods."""
 
-    def test_get_dialog_messages_method_exists(self):
-        """Test that get_dialog_messages method exists."""
-        viewer = cursor_chronicle.CursorChatViewer()
-        self.assertTrue(hasattr(viewer, "get_dialog_messages"))
+    @classmethod
+    def setUpClass(cls):
+        cls.viewer = cursor_chronicle.CursorChatViewer()
 
     def test_format_attached_files_method_exists(self):
         """Test that format_attached_files method exists."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         self.assertTrue(hasattr(viewer, "format_attached_files"))
         result = viewer.format_attached_files([], 1)
         self.assertEqual(result, "")
 
     def test_format_tool_call_method_exists(self):
         """Test that format_tool_call method exists."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         self.assertTrue(hasattr(viewer, "format_tool_call"))
         result = viewer.format_tool_call({}, 1)
         self.assertEqual(result, "")
 
     def test_format_token_info_method_exists(self):
         """Test that format_token_info method exists."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         self.assertTrue(hasattr(viewer, "format_token_info"))
         result = viewer.format_token_info({})
         self.assertEqual(result, "")
 
     def test_infer_model_from_context_method_exists(self):
         """Test that infer_model_from_context method exists."""
-        viewer = cursor_chronicle.CursorChatViewer()
+        viewer = self.viewer
         self.assertTrue(hasattr(viewer, "infer_model_from_context"))
         result = viewer.infer_model_from_context({}, 100)
         self.assertIsInstance(result, str)
@@ -557,9 +552,7 @@ class TestGetProjectsGlobalComposerHeaders(unittest.TestCase):
             self.assertEqual(projects[0]["project_name"], "myapp")
             self.assertEqual(projects[0]["folder_path"], "/home/user/myapp")
             self.assertEqual(len(projects[0]["composers"]), 2)
-            self.assertEqual(
-                projects[0]["latest_dialog"]["composerId"], "bbb"
-            )
+            self.assertEqual(projects[0]["latest_dialog"]["composerId"], "bbb")
 
     def test_global_headers_multiple_projects(self):
         """Composers from different workspaces produce separate projects."""
@@ -654,9 +647,7 @@ class TestGetProjectsGlobalComposerHeaders(unittest.TestCase):
 
             projects = viewer.get_projects()
             all_composer_ids = [
-                c.get("composerId")
-                for p in projects
-                for c in p["composers"]
+                c.get("composerId") for p in projects for c in p["composers"]
             ]
             self.assertEqual(all_composer_ids.count("shared-id"), 1)
 
@@ -752,7 +743,6 @@ class TestGetProjectsGlobalComposerHeaders(unittest.TestCase):
             self.assertEqual(projects[0]["folder_path"], "/Users/dev/StringUriProj")
             self.assertEqual(projects[0]["project_name"], "StringUriProj")
 
-
     def test_global_headers_file_uri_decoded(self):
         """file:// URIs in workspaceIdentifier.uri.external are decoded."""
         with tempfile.TemporaryDirectory() as tmp: